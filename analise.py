@@ -0,0 +1,310 @@
+"""
+Agregações da análise de frequência, com motor pandas ou Polars.
+
+O motor da agregação do histórico bruto (resumir_registros, usada por
+reconstruir_resumo e pela ação "resumo" do import_data.py) é escolhido
+por config.MOTOR_ANALISE ('pandas', padrão, ou 'polars'). Os dois produzem
+exatamente o mesmo resultado: o Polars faz a parte pesada (leitura, filtro
+e agrupamento) em uma consulta lazy. As demais funções recebem DataFrames
+pandas já em memória e agregam sempre com pandas: convertê-los para Polars
+custa mais do que o agrupamento economiza, em qualquer tamanho medido.
+
+As funções de análise (presenca_mensal, distribuicao_tipos, indicadores,
+resumo_pessoa) recebem o resumo de frequência e não dependem do
+Streamlit: são usadas pelas páginas do aplicativo e pelo relatorios.py.
+"""
+from contextlib import closing
+
+import numpy as np
+import pandas as pd
+
+import armazenamento
+import config
+
+# Chaves do resumo de frequência (ver armazenamento.COLUNAS_RESUMO)
+CHAVES_RESUMO = ['Nome', 'Momento', 'Ano', 'Mês', 'Tipo de presença']
+
+# O 2º Momento começou em config.INICIO_SEGUNDO_MOMENTO; os meses anteriores não entram na análise
+PERIODO_INICIO_SEGUNDO_MOMENTO = armazenamento.periodo(
+    config.INICIO_SEGUNDO_MOMENTO.year, config.INICIO_SEGUNDO_MOMENTO.month
+)
+
+
+def _motor(motor=None):
+    """
+    Resolve o motor de análise, voltando para pandas se o Polars não estiver instalado.
+    """
+    motor = motor or config.MOTOR_ANALISE
+    if motor not in ('pandas', 'polars'):
+        raise ValueError(f"Motor de análise desconhecido: {motor}")
+    if motor == 'polars':
+        try:
+            import polars  # noqa: F401
+        except ImportError:
+            print("Aviso: Polars não está instalado, usando pandas")
+            return 'pandas'
+    return motor
+
+
+def _normalizar_resumo(resumo):
+    """
+    Ordena e padroniza os tipos do resumo para que os dois motores coincidam.
+    """
+    resumo = armazenamento.tipar_resumo(resumo)
+    return resumo.sort_values(CHAVES_RESUMO, ignore_index=True)
+
+
+def resumir_registros(anos=None, motor=None, caminho=None):
+    """
+    Lê o histórico bruto, filtra pelos anos e agrega no formato do resumo.
+    """
+    if _motor(motor) == 'polars':
+        return _resumir_registros_polars(anos, caminho)
+    return _resumir_registros_pandas(anos, caminho)
+
+
+def reconstruir_resumo(motor=None, caminho=None, tentativas=3):
+    """
+    Recalcula o resumo gravado no banco a partir do histórico bruto, com o
+    motor de config.MOTOR_ANALISE (ou `motor`). Repete o cálculo se houver
+    uma gravação de frequência no meio. Retorna o número de linhas do resumo.
+    """
+    for _ in range(tentativas):
+        versao = armazenamento.versao_dados(caminho)
+        linhas = armazenamento.substituir_resumo(resumir_registros(motor=motor, caminho=caminho), versao, caminho)
+        if linhas is not None:
+            return linhas
+    raise RuntimeError(f"Resumo não recalculado: o histórico mudou durante {tentativas} tentativas")
+
+
+def _resumir_registros_pandas(anos, caminho):
+    df = armazenamento.carregar_registros(caminho, anos)
+    ano = df['Período'] // 100
+
+    tipo = df['Tipo de presença']
+    if tipo.isna().any():
+        tipo = tipo.cat.add_categories('').fillna('')
+
+    chaves = [df['Nome'], df['Momento'], ano.rename('Ano'), (df['Período'] % 100).rename('Mês'), tipo]
+    resumo = df['Frequência'].eq('Presente').groupby(chaves, observed=True).agg(['size', 'sum'])
+    resumo = resumo.rename(columns={'size': 'Registros', 'sum': 'Presentes'}).reset_index()
+    return _normalizar_resumo(resumo)
+
+
+def _resumir_registros_polars(anos, caminho):
+    import polars as pl
+
+    filtro, parametros = armazenamento.filtro_anos(anos, 'data')
+    sql = f'SELECT data, participante_id, momento, frequencia, tipo_presenca FROM frequencia {filtro}'
+    with closing(armazenamento.conectar(caminho)) as con:
+        registros = pl.read_database(sql, connection=con, execute_options={'parameters': parametros})
+
+        consulta = registros.lazy().with_columns(
+            pl.col('data').str.slice(0, 4).cast(pl.Int64).alias('Ano'),
+            pl.col('data').str.slice(5, 2).cast(pl.Int64).alias('Mês'),
+        )
+
+        # Agrupar pelo id inteiro; o nome entra só nas linhas do resumo
+        resumo = consulta.group_by(
+            'participante_id',
+            pl.col('momento').alias('Momento'),
+            'Ano',
+            'Mês',
+            pl.col('tipo_presenca').fill_null('').alias('Tipo de presença'),
+        ).agg(
+            pl.count().alias('Registros'),
+            (pl.col('frequencia') == 'Presente').sum().alias('Presentes'),
+        ).collect().to_pandas()
+        resumo.insert(0, 'Nome', armazenamento.nomes_participantes(con, resumo.pop('participante_id')))
+    return _normalizar_resumo(resumo)
+
+
+def percentual_mensal(df):
+    """
+    Calcula os percentuais de presença e ausência por mês.
+
+    Aceita o resumo (colunas 'Registros'/'Presentes') ou os registros brutos;
+    tudo é agrupado pela chave inteira 'Período', sem funções Python por
+    grupo. Retorna um DataFrame indexado por 'Mês/Ano' em ordem cronológica.
+    """
+    if 'Registros' in df.columns:
+        mensal = df.groupby('Período')[['Registros', 'Presentes']].sum()
+    else:
+        mensal = df['Frequência'].eq('Presente').groupby(df['Período']).agg(['size', 'sum'])
+        mensal.columns = ['Registros', 'Presentes']
+
+    mensal = mensal.astype('int64')
+    periodos = mensal.index.to_numpy()
+    mensal.index = (
+        pd.Index(periodos % 100).astype(str).str.zfill(2) + '/' + pd.Index(periodos // 100).astype(str)
+    ).rename('Mês/Ano')
+    mensal['Frequência'] = (mensal['Presentes'] / mensal['Registros'] * 100).round(1)
+    mensal['Ausência'] = 100 - mensal['Frequência']
+    return mensal
+
+
+def contar_tipos(df):
+    """
+    Conta os registros por tipo de presença (equivale ao value_counts dos dados brutos).
+
+    Aceita o resumo (somando 'Registros') ou os registros brutos.
+    """
+    if 'Registros' in df.columns:
+        contagens = df.groupby('Tipo de presença', observed=True)['Registros'].sum()
+    else:
+        contagens = df.groupby('Tipo de presença', observed=True).size()
+
+    contagens = contagens.astype('int64').rename('Registros')
+    contagens.index = contagens.index.astype(str).rename('Tipo de presença')
+    contagens = contagens.sort_index()
+    return contagens[(contagens.index != '') & (contagens > 0)]
+
+
+def filtrar(resumo, momento=None, ano=None, nome=None, meses=None):
+    """
+    Filtra o resumo por momento (1, 2 ou None para todos os registros), ano, nome
+    e intervalo de meses (tupla inicial, final).
+    """
+    filtro = pd.Series(True, index=resumo.index)
+    if momento == 1:
+        filtro &= resumo['Momento'] == 1
+    elif momento == 2:
+        filtro &= (resumo['Momento'] == 2) & (resumo['Período'] >= PERIODO_INICIO_SEGUNDO_MOMENTO)
+    elif momento is not None:
+        raise ValueError(f"Momento desconhecido: {momento}")
+    if ano is not None:
+        filtro &= resumo['Ano'] == ano
+    if nome is not None:
+        filtro &= resumo['Nome'] == nome
+    if meses is not None:
+        filtro &= resumo['Mês'].between(*meses)
+    return resumo[filtro]
+
+
+def presenca_mensal(resumo, momento=None, ano=None):
+    """
+    Percentual de presença e ausência por mês de um momento.
+    """
+    return percentual_mensal(filtrar(resumo, momento, ano))
+
+
+def distribuicao_tipos(resumo, momento=None, ano=None):
+    """
+    Registros por tipo de presença de um momento.
+    """
+    return contar_tipos(filtrar(resumo, momento, ano))
+
+
+def _percentual(parte, total):
+    return float(parte / total * 100) if total > 0 else 0.0
+
+
+def indicadores(resumo):
+    """
+    Totais e percentuais de um recorte do resumo (já filtrado).
+    """
+    registros = int(resumo['Registros'].sum())
+    presentes = int(resumo['Presentes'].sum())
+    tipos = contar_tipos(resumo)
+    presencial_online = int(tipos.get('Presencial', 0) + tipos.get('Online', 0))
+    ausentes = int(tipos.get('Ausente', 0))
+    total_tipos = int(tipos.sum())
+    return pd.Series({
+        'Registros': registros,
+        'Presentes': presentes,
+        'Frequência': _percentual(presentes, registros),
+        'Presencial + Online': presencial_online,
+        'Percentual Presencial + Online': _percentual(presencial_online, total_tipos),
+        'Ausente': ausentes,
+        'Percentual Ausente': _percentual(ausentes, total_tipos),
+    }, dtype=object)
+
+
+def resumo_pessoa(resumo, nome, ano=None, meses=None, momento=None):
+    """
+    Indicadores de uma pessoa no período (ano e intervalo de meses) e momento escolhidos.
+    """
+    return indicadores(filtrar(resumo, momento, ano, nome, meses)).rename(nome)
+
+
+def indicadores_anuais(resumo, ano):
+    """
+    Registros, presenças e percentual de presença do ano: total e por momento.
+    """
+    linhas = {momento: filtrar(resumo, momento, ano)[['Registros', 'Presentes']].sum() for momento in (1, 2)}
+    tabela = pd.DataFrame({'Total': linhas[1] + linhas[2], '1º Momento': linhas[1], '2º Momento': linhas[2]}).T
+    tabela = tabela.astype('int64')
+    tabela['Frequência'] = [_percentual(p, r) for r, p in zip(tabela['Registros'], tabela['Presentes'])]
+    return tabela
+
+
+def comparacao_anual(resumo):
+    """
+    Percentual de presença de cada ano do resumo: total e por momento (anos nas
+    linhas). Momentos sem registros no ano ficam vazios (NaN).
+    """
+    comparacao = {}
+    for ano in sorted(resumo['Ano'].unique()):
+        tabela = indicadores_anuais(resumo, ano)
+        comparacao[ano] = tabela['Frequência'].where(tabela['Registros'] > 0)
+    return pd.DataFrame(comparacao).T.rename_axis('Ano')
+
+
+def frequencia_mensal_por_ano(resumo, momento=None):
+    """
+    Percentual de presença por mês (linhas 1 a 12) de cada ano (colunas), para comparar os anos.
+    """
+    mensal = filtrar(resumo, momento).groupby(['Mês', 'Ano'])[['Registros', 'Presentes']].sum()
+    mensal = mensal[mensal['Registros'] > 0]
+    frequencia = (mensal['Presentes'] / mensal['Registros'] * 100).round(1)
+    return frequencia.unstack('Ano').reindex(range(1, 13))
+
+
+def series_por_pessoa(resumo):
+    """
+    Separa o resumo por participante e momento, em ordem de período.
+
+    Retorna {nome: {momento: DataFrame}}, com momento None (todos), 1 ou 2.
+    Calculado uma vez por versão dos dados, troca de nome e de intervalo vira
+    uma consulta ao dicionário e uma fatia (ver recortar_periodo). Os
+    DataFrames são compartilhados e não devem ser alterados.
+    """
+    ordenado, indice = indexar_por_nome(resumo, 'Período')
+    series = {}
+    for nome in indice:
+        df_pessoa = linhas_pessoa(ordenado, indice, nome).reset_index(drop=True)
+        series[nome] = {momento: filtrar(df_pessoa, momento).reset_index(drop=True) for momento in (None, 1, 2)}
+    return series
+
+
+def indexar_por_nome(df, coluna_ordem='Data'):
+    """
+    Ordena por Nome e `coluna_ordem` e monta o índice {nome: (início, fim)}
+    com o intervalo de linhas de cada pessoa, em ordem alfabética.
+    """
+    if df.empty:
+        return df, {}
+    df = df.sort_values(['Nome', coluna_ordem], kind='stable', ignore_index=True)
+
+    # Início de cada bloco: linhas em que o nome muda
+    codigos = pd.factorize(df['Nome'])[0]
+    inicios = np.flatnonzero(np.r_[True, codigos[1:] != codigos[:-1]])
+    fins = np.r_[inicios[1:], len(df)]
+    nomes = df['Nome'].to_numpy()[inicios]
+    return df, {nome: (int(inicio), int(fim)) for nome, inicio, fim in zip(nomes, inicios, fins)}
+
+
+def linhas_pessoa(df, indice, nome):
+    """
+    Linhas de uma pessoa em um DataFrame indexado por indexar_por_nome, em O(linhas da pessoa).
+    """
+    inicio, fim = indice.get(nome, (0, 0))
+    return df.iloc[inicio:fim]
+
+
+def recortar_periodo(serie, inicio, fim):
+    """
+    Fatia uma série ordenada por 'Período' entre dois períodos aaaamm (inclusive), por busca binária.
+    """
+    periodos = serie['Período'].to_numpy()
+    return serie.iloc[periodos.searchsorted(inicio, 'left'):periodos.searchsorted(fim, 'right')]
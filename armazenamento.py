@@ -0,0 +1,664 @@
+"""
+Armazenamento do histórico de frequência em SQLite.
+
+Cada envio de frequência grava apenas as linhas da sessão no banco, sem
+reler nem regravar o histórico. Os registros são únicos por (data,
+momento, participante): reenviar uma sessão substitui as linhas no lugar.
+A planilha lista_frequencia_ma.xlsx fica apenas como formato de
+importação/exportação.
+
+A frequência e o resumo guardam o id do participante (tabela
+`participantes`, ver participantes.py), não o nome: as leituras juntam o
+nome atual pelo id, então renomear alguém não divide o seu histórico.
+Registros gravados pelo nome (importações) usam o participante com esse
+nome, cadastrado na hora se ainda não existir.
+"""
+import os
+import queue
+import sqlite3
+import threading
+from collections import Counter
+from concurrent.futures import Future
+from contextlib import closing
+
+import pandas as pd
+
+import config
+
+# Colunas do DataFrame de frequência usado pelo aplicativo
+COLUNAS = ['Data', 'Nome', 'Momento', 'Frequência', 'Tipo de presença', 'Data Correta']
+
+# Colunas do resumo agregado por pessoa, momento, mês e tipo de presença
+COLUNAS_RESUMO = ['Nome', 'Momento', 'Ano', 'Mês', 'Tipo de presença', 'Registros', 'Presentes']
+
+# Colunas de texto com poucos valores distintos, carregadas como categorias
+_CATEGORIAS_REGISTROS = ['Nome', 'Frequência', 'Tipo de presença', 'Data Correta']
+_CATEGORIAS_RESUMO = ['Nome', 'Tipo de presença']
+
+# Recalcula o resumo inteiro a partir dos registros brutos (esquema anterior aos ids de participante,
+# usado só pelas migrações antigas)
+_SQL_RECONSTRUIR_RESUMO_POR_NOME = """
+    DELETE FROM resumo_frequencia;
+    INSERT INTO resumo_frequencia (nome, momento, ano, mes, tipo_presenca, registros, presentes)
+    SELECT nome, momento,
+           CAST(substr(data, 1, 4) AS INTEGER),
+           CAST(substr(data, 6, 2) AS INTEGER),
+           COALESCE(tipo_presenca, ''),
+           COUNT(*),
+           SUM(frequencia = 'Presente')
+    FROM frequencia
+    GROUP BY 1, 2, 3, 4, 5;
+"""
+
+# Recalcula o resumo inteiro a partir dos registros brutos
+_SQL_RECONSTRUIR_RESUMO = """
+    DELETE FROM resumo_frequencia;
+    INSERT INTO resumo_frequencia (participante_id, momento, ano, mes, tipo_presenca, registros, presentes)
+    SELECT participante_id, momento,
+           CAST(substr(data, 1, 4) AS INTEGER),
+           CAST(substr(data, 6, 2) AS INTEGER),
+           COALESCE(tipo_presenca, ''),
+           COUNT(*),
+           SUM(frequencia = 'Presente')
+    FROM frequencia
+    GROUP BY 1, 2, 3, 4, 5;
+"""
+
+# Cada posição corresponde a uma versão do esquema (PRAGMA user_version)
+_MIGRACOES = [
+    """
+    CREATE TABLE IF NOT EXISTS frequencia (
+        data TEXT NOT NULL,
+        nome TEXT NOT NULL,
+        momento INTEGER NOT NULL,
+        frequencia TEXT NOT NULL,
+        tipo_presenca TEXT,
+        data_correta TEXT
+    );
+    CREATE INDEX IF NOT EXISTS idx_frequencia_data ON frequencia (data);
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS resumo_frequencia (
+        nome TEXT NOT NULL,
+        momento INTEGER NOT NULL,
+        ano INTEGER NOT NULL,
+        mes INTEGER NOT NULL,
+        tipo_presenca TEXT NOT NULL,
+        registros INTEGER NOT NULL,
+        presentes INTEGER NOT NULL,
+        PRIMARY KEY (nome, momento, ano, mes, tipo_presenca)
+    ) WITHOUT ROWID;
+    """ + _SQL_RECONSTRUIR_RESUMO_POR_NOME,
+    """
+    CREATE TABLE IF NOT EXISTS versao (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        valor INTEGER NOT NULL
+    );
+    INSERT OR IGNORE INTO versao (id, valor) VALUES (1, 0);
+    """,
+    # Remove duplicatas de envios repetidos (fica o último) e torna a chave única
+    """
+    DELETE FROM frequencia
+    WHERE rowid NOT IN (SELECT MAX(rowid) FROM frequencia GROUP BY data, momento, nome);
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_frequencia_chave ON frequencia (data, momento, nome);
+    """ + _SQL_RECONSTRUIR_RESUMO_POR_NOME + """
+    UPDATE versao SET valor = valor + 1 WHERE id = 1;
+    """,
+    # Leitura por ano: o resumo é consultado pelos anos selecionados na análise
+    """
+    CREATE INDEX IF NOT EXISTS idx_resumo_ano ON resumo_frequencia (ano);
+    """,
+    # Capas dos livros guardadas pelo conteúdo, com contagem de referências (ver capas.py)
+    """
+    CREATE TABLE IF NOT EXISTS capas (
+        caminho TEXT PRIMARY KEY,
+        hash TEXT NOT NULL,
+        referencias INTEGER NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_capas_hash ON capas (hash);
+    """,
+    # Catálogo de livros (antes em livros.xlsx, ver catalogo.py)
+    """
+    CREATE TABLE IF NOT EXISTS livros (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        nome TEXT NOT NULL,
+        autor TEXT NOT NULL,
+        ano INTEGER,
+        capa TEXT NOT NULL DEFAULT ''
+    );
+    CREATE INDEX IF NOT EXISTS idx_livros_nome ON livros (nome COLLATE NOCASE);
+    CREATE TABLE IF NOT EXISTS versao_livros (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        valor INTEGER NOT NULL
+    );
+    INSERT OR IGNORE INTO versao_livros (id, valor) VALUES (1, 0);
+    """,
+    # Cadastro de participantes com id estável; frequência e resumo passam a
+    # guardar o id em vez do nome. Cada nome do histórico vira um participante
+    # (ativo desde o primeiro registro); os momentos vêm de participantes_momentos.xlsx
+    """
+    CREATE TABLE IF NOT EXISTS participantes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        nome TEXT NOT NULL UNIQUE,
+        primeiro_momento INTEGER NOT NULL DEFAULT 0,
+        segundo_momento INTEGER NOT NULL DEFAULT 0,
+        inicio TEXT,
+        fim TEXT
+    );
+    CREATE TABLE IF NOT EXISTS versao_participantes (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        valor INTEGER NOT NULL
+    );
+    INSERT OR IGNORE INTO versao_participantes (id, valor) VALUES (1, 0);
+    INSERT INTO participantes (nome, inicio)
+    SELECT nome, MIN(data) FROM frequencia GROUP BY nome ORDER BY nome;
+
+    CREATE TABLE frequencia_por_id (
+        data TEXT NOT NULL,
+        participante_id INTEGER NOT NULL REFERENCES participantes (id),
+        momento INTEGER NOT NULL,
+        frequencia TEXT NOT NULL,
+        tipo_presenca TEXT,
+        data_correta TEXT
+    );
+    INSERT INTO frequencia_por_id (data, participante_id, momento, frequencia, tipo_presenca, data_correta)
+    SELECT f.data, p.id, f.momento, f.frequencia, f.tipo_presenca, f.data_correta
+    FROM frequencia f JOIN participantes p ON p.nome = f.nome
+    ORDER BY f.rowid;
+    DROP TABLE frequencia;
+    ALTER TABLE frequencia_por_id RENAME TO frequencia;
+    CREATE INDEX idx_frequencia_data ON frequencia (data);
+    CREATE UNIQUE INDEX idx_frequencia_chave ON frequencia (data, momento, participante_id);
+    CREATE INDEX idx_frequencia_participante ON frequencia (participante_id, data);
+
+    DROP TABLE resumo_frequencia;
+    CREATE TABLE resumo_frequencia (
+        participante_id INTEGER NOT NULL REFERENCES participantes (id),
+        momento INTEGER NOT NULL,
+        ano INTEGER NOT NULL,
+        mes INTEGER NOT NULL,
+        tipo_presenca TEXT NOT NULL,
+        registros INTEGER NOT NULL,
+        presentes INTEGER NOT NULL,
+        PRIMARY KEY (participante_id, momento, ano, mes, tipo_presenca)
+    ) WITHOUT ROWID;
+    CREATE INDEX idx_resumo_ano ON resumo_frequencia (ano);
+    """ + _SQL_RECONSTRUIR_RESUMO + """
+    UPDATE versao SET valor = valor + 1 WHERE id = 1;
+    """,
+]
+
+# Incrementa o contador de versão (usado para invalidar caches de leitura)
+_SQL_NOVA_VERSAO = 'UPDATE versao SET valor = valor + 1 WHERE id = 1'
+
+
+_bancos_inicializados = set()
+
+
+def conectar(caminho=None):
+    """
+    Abre uma conexão com o banco, criando o esquema na primeira vez.
+    """
+    caminho = caminho or config.ARQUIVO_BANCO
+    con = sqlite3.connect(caminho, timeout=30)
+    con.execute('PRAGMA journal_mode=WAL')
+    con.execute('PRAGMA synchronous=NORMAL')
+
+    if caminho not in _bancos_inicializados:
+        novo = _migrar(con)
+        _bancos_inicializados.add(caminho)
+
+        # Banco recém-criado: importar o histórico da planilha, se existir
+        if novo and caminho == config.ARQUIVO_BANCO and os.path.exists(config.ARQUIVO_FREQUENCIA_EXCEL):
+            importar_excel(config.ARQUIVO_FREQUENCIA_EXCEL, con=con)
+
+    return con
+
+
+def _comandos(script):
+    """
+    Divide um script SQL em comandos (executescript faria COMMIT fora da nossa transação).
+    """
+    comando = ''
+    for parte in script.split(';'):
+        comando += parte + ';'
+        if sqlite3.complete_statement(comando):
+            if comando.strip(' \n;'):
+                yield comando
+            comando = ''
+
+
+def _migrar(con):
+    """
+    Aplica as migrações pendentes, uma transação por versão.
+    Retorna True se esta conexão criou o banco (aplicou a primeira migração).
+    """
+    criou = False
+    while con.execute('PRAGMA user_version').fetchone()[0] < len(_MIGRACOES):
+        with con:
+            con.execute('BEGIN IMMEDIATE')
+            # Reler dentro da trava: outro processo pode ter migrado antes
+            versao = con.execute('PRAGMA user_version').fetchone()[0]
+            if versao < len(_MIGRACOES):
+                for comando in _comandos(_MIGRACOES[versao]):
+                    con.execute(comando)
+                con.execute(f'PRAGMA user_version = {versao + 1}')
+                criou = criou or versao == 0
+    return criou
+
+
+def _datas_iso(serie):
+    """
+    Converte uma coluna de datas (datetime ou texto dd/mm/aaaa) para texto ISO.
+    """
+    if not pd.api.types.is_datetime64_any_dtype(serie):
+        serie = pd.to_datetime(serie, dayfirst=True)
+    return serie.dt.strftime('%Y-%m-%d')
+
+
+def normalizar_nome(valor):
+    """
+    Nome sem espaços nas pontas e com espaços internos simples; vazio ou ausente vira None.
+    Usado por todas as entradas de nomes, para que a mesma pessoa não vire dois participantes.
+    """
+    if valor is None or pd.isna(valor):
+        return None
+    return ' '.join(str(valor).split()) or None
+
+
+def _preparar_linhas(df):
+    """
+    Converte um DataFrame no formato do aplicativo em tuplas para o SQLite.
+    Com a coluna 'ID', os registros são do participante com esse id; sem
+    ela, do participante com o nome da coluna 'Nome'.
+    """
+    if 'ID' in df:
+        df = df.reindex(columns=['ID', *COLUNAS]).dropna(subset=['Data', 'ID'])
+        participantes = df['ID'].astype(int)
+    else:
+        df = df.reindex(columns=COLUNAS)
+        df = df.assign(Nome=df['Nome'].map(normalizar_nome)).dropna(subset=['Data', 'Nome'])
+        participantes = df['Nome'].astype(str)
+    datas = _datas_iso(df['Data'])
+    return list(zip(
+        datas,
+        participantes,
+        df['Momento'].astype(int),
+        df['Frequência'].astype(str),
+        _texto_ou_nulo(df['Tipo de presença']),
+        _texto_ou_nulo(df['Data Correta']),
+    ))
+
+
+def _texto_ou_nulo(serie):
+    # Valores ausentes viram None (NULL no SQLite), inclusive em colunas categóricas
+    serie = serie.astype(object)
+    return serie.where(serie.notna(), None)
+
+
+def periodo(ano, mes):
+    """
+    Chave inteira de período (aaaamm), que ordena cronologicamente.
+    """
+    return ano * 100 + mes
+
+
+def tipar_registros(df):
+    """
+    Converte o texto repetitivo em categorias e acrescenta a chave inteira 'Período'.
+    """
+    df = df.astype({coluna: 'category' for coluna in _CATEGORIAS_REGISTROS})
+    df['Momento'] = df['Momento'].astype('int8')
+    df['Período'] = periodo(df['Data'].dt.year, df['Data'].dt.month).astype('int32')
+    return df
+
+
+def tipar_resumo(df):
+    """
+    Padroniza os tipos do resumo: categorias, inteiros compactos e a chave 'Período'.
+    """
+    df = df[COLUNAS_RESUMO].astype({
+        'Momento': 'int8', 'Ano': 'int16', 'Mês': 'int8',
+        'Registros': 'int32', 'Presentes': 'int32',
+    })
+    for coluna in _CATEGORIAS_RESUMO:
+        df[coluna] = df[coluna].astype('category').cat.remove_unused_categories()
+    df['Período'] = periodo(df['Ano'].astype('int32'), df['Mês'].astype('int32'))
+    return df
+
+
+def _chave(linha):
+    # Chave única de um registro: (data, momento, participante)
+    return linha[0], linha[2], linha[1]
+
+
+def _com_ids(con, linhas):
+    """
+    Troca os nomes das linhas gravadas pelo nome (importações) pelos ids dos
+    participantes, cadastrando os nomes novos (ativos desde o primeiro registro).
+    """
+    inicios = {}
+    for data, participante, *_ in linhas:
+        if isinstance(participante, str):
+            inicios[participante] = min(data, inicios.get(participante, data))
+    if not inicios:
+        return linhas
+
+    ids = dict(con.execute(
+        f"SELECT nome, id FROM participantes WHERE nome IN ({', '.join('?' * len(inicios))})", list(inicios)
+    ).fetchall())
+    novos = [(nome, inicio) for nome, inicio in inicios.items() if nome not in ids]
+    if novos:
+        con.executemany('INSERT INTO participantes (nome, inicio) VALUES (?, ?)', novos)
+        ids.update(con.execute(
+            f"SELECT nome, id FROM participantes WHERE nome IN ({', '.join('?' * len(novos))})",
+            [nome for nome, _ in novos],
+        ).fetchall())
+    return [(data, ids.get(participante, participante), *resto) for data, participante, *resto in linhas]
+
+
+def _sem_duplicatas(linhas, manter_primeira=False):
+    """
+    Mantém uma linha por chave: a última (como uma regravação) ou a primeira.
+    """
+    unicas = {}
+    for linha in linhas:
+        chave = _chave(linha)
+        if not (manter_primeira and chave in unicas):
+            unicas[chave] = linha
+    return list(unicas.values())
+
+
+def _contagens_resumo(novas, antigas=()):
+    """
+    Variação do resumo (participante, momento, ano, mês, tipo) ao trocar `antigas` por `novas`.
+    """
+    contagens = Counter()
+    presentes = Counter()
+    for sinal, linhas in ((1, novas), (-1, antigas)):
+        for data, participante, momento, frequencia, tipo_presenca, _ in linhas:
+            chave = (participante, momento, int(data[:4]), int(data[5:7]), tipo_presenca or '')
+            contagens[chave] += sinal
+            presentes[chave] += sinal * (frequencia == 'Presente')
+    return [
+        chave + (contagens[chave], presentes[chave])
+        for chave in contagens
+        if contagens[chave] or presentes[chave]
+    ]
+
+
+def _linhas_existentes(con, linhas):
+    """
+    Busca as linhas já gravadas com as mesmas chaves (pelo índice único).
+    """
+    existentes = []
+    for chave in map(_chave, linhas):
+        linha = con.execute("""
+            SELECT data, participante_id, momento, frequencia, tipo_presenca, data_correta
+            FROM frequencia WHERE data = ? AND momento = ? AND participante_id = ?
+        """, chave).fetchone()
+        if linha is not None:
+            existentes.append(linha)
+    return existentes
+
+
+def _gravar(con, linhas, substituir=True):
+    """
+    Grava as linhas e ajusta o resumo na mesma transação.
+
+    Linhas com a chave de um registro existente o substituem, ou são
+    ignoradas se substituir for False. Retorna o número de linhas gravadas.
+    """
+    with con:
+        con.execute('BEGIN IMMEDIATE')
+        linhas = _sem_duplicatas(_com_ids(con, linhas), manter_primeira=not substituir)
+        antigas = _linhas_existentes(con, linhas)
+        if not substituir:
+            existentes = set(map(_chave, antigas))
+            linhas = [linha for linha in linhas if _chave(linha) not in existentes]
+            antigas = []
+        con.executemany("""
+            INSERT INTO frequencia (data, participante_id, momento, frequencia, tipo_presenca, data_correta)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (data, momento, participante_id) DO UPDATE SET
+                frequencia = excluded.frequencia,
+                tipo_presenca = excluded.tipo_presenca,
+                data_correta = excluded.data_correta
+        """, linhas)
+        con.executemany("""
+            INSERT INTO resumo_frequencia (participante_id, momento, ano, mes, tipo_presenca, registros, presentes)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (participante_id, momento, ano, mes, tipo_presenca) DO UPDATE SET
+                registros = registros + excluded.registros,
+                presentes = presentes + excluded.presentes
+        """, _contagens_resumo(linhas, antigas))
+        if antigas:
+            con.execute('DELETE FROM resumo_frequencia WHERE registros = 0')
+        con.execute(_SQL_NOVA_VERSAO)
+    return len(linhas)
+
+
+class _Escritor:
+    """
+    Escritor único do processo: uma thread consome a fila de gravações e
+    junta os pedidos pendentes em uma só transação por banco. As sessões do
+    Streamlit (threads) esperam o resultado do próprio pedido; as leituras
+    não passam pela fila e, no modo WAL, não são bloqueadas pelas escritas.
+    Entre processos, a serialização fica a cargo da trava do SQLite
+    (BEGIN IMMEDIATE + timeout).
+    """
+
+    def __init__(self):
+        self._fila = queue.Queue()
+        self._trava = threading.Lock()
+        self._thread = None
+
+    def gravar(self, caminho, linhas, substituir=True):
+        with self._trava:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._executar, name='escritor-frequencia', daemon=True)
+                self._thread.start()
+
+        futuro = Future()
+        self._fila.put((caminho, substituir, linhas, futuro))
+        return futuro.result()
+
+    def _executar(self):
+        while True:
+            pedidos = [self._fila.get()]
+            # Juntar o que já estiver na fila (envios simultâneos)
+            while True:
+                try:
+                    pedidos.append(self._fila.get_nowait())
+                except queue.Empty:
+                    break
+
+            por_banco = {}
+            for pedido in pedidos:
+                por_banco.setdefault(pedido[:2], []).append(pedido)
+            for (caminho, substituir), pedidos_banco in por_banco.items():
+                self._gravar_lote(caminho, substituir, pedidos_banco)
+
+    def _gravar_lote(self, caminho, substituir, pedidos):
+        try:
+            with closing(conectar(caminho)) as con:
+                if substituir and len(pedidos) > 1:
+                    try:
+                        _gravar(con, [linha for _, _, linhas, _ in pedidos for linha in linhas])
+                        for _, _, linhas, futuro in pedidos:
+                            futuro.set_result(len(_sem_duplicatas(linhas)))
+                        return
+                    except Exception:
+                        pass  # Lote recusado: gravar um a um para isolar o pedido com erro
+
+                # Um a um: pedido único, importação (conta as linhas ignoradas) ou lote recusado
+                for _, _, linhas, futuro in pedidos:
+                    try:
+                        futuro.set_result(_gravar(con, linhas, substituir))
+                    except Exception as e:
+                        futuro.set_exception(e)
+        except Exception as e:
+            for _, _, _, futuro in pedidos:
+                if not futuro.done():
+                    futuro.set_exception(e)
+
+
+_escritor = _Escritor()
+
+
+def inserir_registros(df, caminho=None, con=None, substituir=True):
+    """
+    Grava registros de frequência no banco em uma única transação.
+
+    Um registro com a mesma (data, momento, participante) de outro já
+    gravado o substitui, então reenviar uma sessão não duplica a frequência. Com
+    substituir=False (importação de históricos), os registros já gravados
+    são mantidos e as linhas repetidas ignoradas. Sem `con`, a gravação
+    passa pelo escritor único do processo, o que torna seguros os envios
+    simultâneos de várias sessões.
+
+    Retorna o número de registros gravados.
+    """
+    linhas = _preparar_linhas(df)
+    if not linhas:
+        return 0
+
+    if con is not None:
+        return _gravar(con, linhas, substituir)
+    return _escritor.gravar(caminho or config.ARQUIVO_BANCO, linhas, substituir)
+
+
+def filtro_anos(anos, coluna_data=None):
+    """
+    Cláusula WHERE e parâmetros para ler apenas os anos pedidos (todos se anos for None).
+
+    Com `coluna_data`, cada ano vira um intervalo de datas ISO, que usa o
+    índice por data; sem ela, filtra pela coluna inteira 'ano' do resumo.
+    """
+    if anos is None:
+        return '', []
+    anos = sorted(set(int(ano) for ano in anos))
+    if not anos:
+        return 'WHERE 0', []
+    if coluna_data is None:
+        return f"WHERE ano IN ({', '.join('?' * len(anos))})", anos
+    intervalos = ' OR '.join(f'({coluna_data} >= ? AND {coluna_data} < ?)' for _ in anos)
+    return f'WHERE {intervalos}', [data for ano in anos for data in (f'{ano}-01-01', f'{ano + 1}-01-01')]
+
+
+def nomes_participantes(con, ids):
+    """
+    Nome atual de cada id de participante, como categoria (nomes em ordem alfabética).
+    A junção é feita pelos ids inteiros, sem repetir o texto do nome em cada linha lida.
+    """
+    cadastro = con.execute('SELECT id, nome FROM participantes ORDER BY nome').fetchall()
+    ids_cadastro = pd.Index([id_participante for id_participante, _ in cadastro])
+    nomes = pd.Categorical.from_codes(
+        ids_cadastro.get_indexer(ids), categories=[nome for _, nome in cadastro]
+    )
+    return nomes.remove_unused_categories()
+
+
+def carregar_registros(caminho=None, anos=None):
+    """
+    Lê o histórico de frequência (de todos os anos, ou só dos anos pedidos) como DataFrame.
+    """
+    filtro, parametros = filtro_anos(anos, 'data')
+    sql = f"""
+        SELECT data AS "Data", participante_id, momento AS "Momento",
+               frequencia AS "Frequência", tipo_presenca AS "Tipo de presença",
+               data_correta AS "Data Correta"
+        FROM frequencia
+        {filtro}
+        ORDER BY data, rowid
+    """
+    with closing(conectar(caminho)) as con:
+        df = pd.read_sql_query(sql, con, params=parametros)
+        df.insert(1, 'Nome', nomes_participantes(con, df.pop('participante_id')))
+    df['Data'] = pd.to_datetime(df['Data'], format='%Y-%m-%d')
+    return tipar_registros(df)
+
+
+def carregar_resumo(caminho=None, anos=None):
+    """
+    Lê o resumo pré-agregado de frequência (algumas centenas de linhas por ano),
+    de todos os anos ou só dos anos pedidos.
+    """
+    filtro, parametros = filtro_anos(anos)
+    sql = f"""
+        SELECT participante_id, momento AS "Momento", ano AS "Ano", mes AS "Mês",
+               tipo_presenca AS "Tipo de presença", registros AS "Registros",
+               presentes AS "Presentes"
+        FROM resumo_frequencia
+        {filtro}
+    """
+    with closing(conectar(caminho)) as con:
+        df = pd.read_sql_query(sql, con, params=parametros)
+        df.insert(0, 'Nome', nomes_participantes(con, df.pop('participante_id')))
+    return tipar_resumo(df)
+
+
+def anos_disponiveis(caminho=None):
+    """
+    Anos com registros de frequência, em ordem crescente.
+    """
+    with closing(conectar(caminho)) as con:
+        return [ano for (ano,) in con.execute('SELECT DISTINCT ano FROM resumo_frequencia ORDER BY ano')]
+
+
+def substituir_resumo(resumo, versao_lida, caminho=None):
+    """
+    Troca todo o resumo gravado por `resumo` (no formato de COLUNAS_RESUMO),
+    calculado a partir do histórico na versão `versao_lida`.
+
+    Se houve escrita depois dessa leitura, o resumo calculado já está
+    desatualizado: nada é gravado e a função retorna None (quem chamou
+    recalcula). Senão, retorna o número de linhas gravadas.
+    """
+    with closing(conectar(caminho)) as con:
+        with con:
+            con.execute('BEGIN IMMEDIATE')
+            if con.execute('SELECT valor FROM versao WHERE id = 1').fetchone()[0] != versao_lida:
+                return None
+            ids = dict(con.execute('SELECT nome, id FROM participantes'))
+            linhas = list(zip(
+                resumo['Nome'].astype(str).map(ids),
+                resumo['Momento'].astype(int),
+                resumo['Ano'].astype(int),
+                resumo['Mês'].astype(int),
+                resumo['Tipo de presença'].astype(str),
+                resumo['Registros'].astype(int),
+                resumo['Presentes'].astype(int),
+            ))
+            con.execute('DELETE FROM resumo_frequencia')
+            con.executemany("""
+                INSERT INTO resumo_frequencia (participante_id, momento, ano, mes, tipo_presenca, registros, presentes)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, linhas)
+            con.execute(_SQL_NOVA_VERSAO)
+    return len(linhas)
+
+
+def versao_dados(caminho=None):
+    """
+    Retorna o contador de versão do banco, incrementado a cada escrita.
+    """
+    with closing(conectar(caminho)) as con:
+        return con.execute('SELECT valor FROM versao WHERE id = 1').fetchone()[0]
+
+
+def importar_excel(arquivo, caminho=None, con=None):
+    """
+    Importa uma planilha no formato de lista_frequencia_ma.xlsx para o banco.
+    """
+    df = pd.read_excel(arquivo, engine='openpyxl')
+    return inserir_registros(df, caminho=caminho, con=con)
+
+
+def exportar_excel(arquivo, caminho=None):
+    """
+    Exporta todo o histórico do banco para uma planilha Excel.
+    """
+    df = carregar_registros(caminho)
+    df[COLUNAS].to_excel(arquivo, sheet_name='frequencia', index=False)
+    return len(df)
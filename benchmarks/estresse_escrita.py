@@ -0,0 +1,106 @@
+"""
+Teste de estresse de gravações simultâneas de frequência.
+
+Vários processos, cada um com várias threads (como sessões do Streamlit),
+enviam sessões de frequência ao mesmo banco ao mesmo tempo, enquanto uma
+thread continua lendo o resumo. Com --reenvios, cada sessão é enviada de
+novo com outras marcações, que devem substituir as anteriores. No fim,
+confere que nenhum registro se perdeu ou duplicou e que o resumo bate com
+os registros brutos.
+
+Uso (na raiz do projeto):
+    python -m benchmarks.estresse_escrita --processos 4 --threads 8 --envios 25
+"""
+import argparse
+import multiprocessing
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+
+import pandas as pd
+
+import armazenamento
+from benchmarks.historico_sintetico import gerar_historico
+
+INICIO = pd.Timestamp('2030-01-07')
+
+
+def _enviar(caminho, participantes, indice, reenvios):
+    # Cada sessão usa uma segunda-feira diferente; os reenvios repetem as chaves
+    gravados = 0
+    for reenvio in range(1 + reenvios):
+        df = gerar_historico(participantes, semanas=1, inicio=INICIO + pd.Timedelta(weeks=indice),
+                             semente=indice * 10 + reenvio)
+        gravados += armazenamento.inserir_registros(df, caminho=caminho)
+    return gravados
+
+
+def _processo(caminho, processo, threads, envios, participantes, reenvios):
+    primeiro = processo * threads * envios
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        indices = range(primeiro, primeiro + threads * envios)
+        return sum(executor.map(lambda i: _enviar(caminho, participantes, i, reenvios), indices))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--processos', type=int, default=4)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--envios', type=int, default=25, help='envios por thread')
+    parser.add_argument('--participantes', type=int, default=30)
+    parser.add_argument('--reenvios', type=int, default=1, help='reenvios de cada sessão')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho = f'{diretorio}/frequencia.db'
+        armazenamento.conectar(caminho).close()
+
+        # Leitor concorrente: as leituras não devem esperar pelas escritas
+        parar = threading.Event()
+        leituras = []
+
+        def ler():
+            while not parar.is_set():
+                inicio = time.perf_counter()
+                armazenamento.carregar_resumo(caminho)
+                leituras.append(time.perf_counter() - inicio)
+
+        leitor = threading.Thread(target=ler)
+        leitor.start()
+
+        inicio = time.perf_counter()
+        contexto = multiprocessing.get_context('spawn')
+        with contexto.Pool(args.processos) as pool:
+            gravados = sum(pool.starmap(_processo, [
+                (caminho, p, args.threads, args.envios, args.participantes, args.reenvios) for p in range(args.processos)
+            ]))
+        duracao = time.perf_counter() - inicio
+        parar.set()
+        leitor.join()
+
+        esperado = args.processos * args.threads * args.envios * args.participantes * 2
+        with closing(armazenamento.conectar(caminho)) as con:
+            no_banco = con.execute('SELECT COUNT(*) FROM frequencia').fetchone()[0]
+            no_resumo = con.execute('SELECT SUM(registros) FROM resumo_frequencia').fetchone()[0]
+            presentes = con.execute("SELECT COUNT(*) FROM frequencia WHERE frequencia = 'Presente'").fetchone()[0]
+            presentes_resumo = con.execute('SELECT SUM(presentes) FROM resumo_frequencia').fetchone()[0]
+
+        envios = args.processos * args.threads * args.envios * (1 + args.reenvios)
+        print(f"{envios} envios simultâneos ({args.processos} processos x {args.threads} threads) "
+              f"em {duracao:.2f} s ({envios / duracao:.0f} envios/s)")
+        print(f"Leituras concorrentes: {len(leituras)}, maior latência {max(leituras, default=0) * 1000:.1f} ms")
+        print(f"Registros esperados {esperado}, no banco {no_banco}, no resumo {no_resumo}; "
+              f"presentes {presentes}, no resumo {presentes_resumo}")
+
+        if not (esperado * (1 + args.reenvios) == gravados and esperado == no_banco == no_resumo
+                and presentes == presentes_resumo):
+            print("FALHA: registros perdidos, duplicados ou resumo inconsistente")
+            sys.exit(1)
+        print("OK: nenhuma atualização perdida")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+"""
+Benchmarks de carga, gravação e análise da frequência, sem Streamlit.
+
+Gera históricos sintéticos (N participantes × M segundas-feiras × 2
+momentos), mede cada etapa várias vezes e informa a latência p50/p95 e o
+pico de memória. Os resultados podem ser gravados como linha de base e
+comparados nas execuções seguintes para detectar regressões.
+
+Uso (na raiz do projeto):
+    python -m benchmarks.executar                      # compara com a linha de base
+    python -m benchmarks.executar --gravar-base        # grava a linha de base
+    python -m benchmarks.executar --semanas 52 520 --participantes 100
+    python -m benchmarks.executar --excel              # inclui a leitura da planilha
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+import analise
+import armazenamento
+from benchmarks.historico_sintetico import criar_banco, gerar_historico
+
+ARQUIVO_BASE = os.path.join(os.path.dirname(__file__), 'resultados', 'baseline.json')
+
+
+def _etapas(caminho, participantes, excel=False):
+    """
+    Etapas medidas: cada uma é uma função sem argumentos sobre o banco `caminho`.
+    """
+    sessoes = iter(pd.date_range('2070-01-01', periods=2000, freq='W-MON'))
+
+    def salvar_sessao():
+        # Uma sessão de um momento, como um clique em "Enviar"
+        df = gerar_historico(participantes, semanas=1, inicio=next(sessoes))
+        armazenamento.inserir_registros(df[df['Momento'] == 1], caminho=caminho)
+
+    def analisar():
+        # Caminho de analise_dados: resumo -> gráficos e indicadores por momento
+        resumo = armazenamento.carregar_resumo(caminho)
+        for momento in (1, 2):
+            df_momento = resumo[resumo['Momento'] == momento]
+            analise.percentual_mensal(df_momento)
+            analise.contar_tipos(df_momento)
+
+    etapas = {}
+    if excel:
+        # Leitura da planilha inteira, como era feito antes do banco SQLite
+        arquivo = os.path.join(os.path.dirname(caminho), 'lista_frequencia_ma.xlsx')
+        armazenamento.exportar_excel(arquivo, caminho=caminho)
+        etapas['ler_excel'] = lambda: pd.read_excel(arquivo, engine='openpyxl')
+
+    return {
+        **etapas,
+        'carregar_registros': lambda: armazenamento.carregar_registros(caminho),
+        'carregar_resumo': lambda: armazenamento.carregar_resumo(caminho),
+        'salvar_frequencia': salvar_sessao,
+        'analise_dados': analisar,
+        'resumir_registros': lambda: analise.resumir_registros(caminho=caminho),
+    }
+
+
+def medir(funcao, repeticoes):
+    """
+    Executa a função `repeticoes` vezes e retorna p50/p95 (ms) e pico de memória (MB).
+    """
+    funcao()  # aquecimento
+
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append((time.perf_counter() - inicio) * 1000)
+
+    # Memória medida em uma execução separada (o tracemalloc distorce o tempo)
+    tracemalloc.start()
+    funcao()
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    tempos.sort()
+    return {
+        'p50_ms': round(statistics.median(tempos), 2),
+        'p95_ms': round(tempos[min(len(tempos) - 1, int(round(0.95 * (len(tempos) - 1))))], 2),
+        'pico_mb': round(pico / 1e6, 2),
+    }
+
+
+def executar(participantes, semanas_lista, repeticoes, excel=False):
+    resultados = {}
+    for semanas in semanas_lista:
+        with tempfile.TemporaryDirectory() as diretorio:
+            historico = gerar_historico(participantes, semanas)
+            caminho = criar_banco(historico, diretorio)
+            cenario = f'{participantes}x{semanas}x2'
+            print(f"\nCenário {cenario} ({len(historico)} registros)")
+
+            for nome, funcao in _etapas(caminho, participantes, excel).items():
+                medida = medir(funcao, repeticoes)
+                resultados[f'{cenario}/{nome}'] = medida
+                print(f"  {nome:<20} p50 {medida['p50_ms']:9.2f} ms   "
+                      f"p95 {medida['p95_ms']:9.2f} ms   pico {medida['pico_mb']:7.2f} MB")
+    return resultados
+
+
+def comparar(resultados, base, tolerancia):
+    """
+    Lista as etapas cujo p50 ou pico de memória pioraram além da tolerância.
+    """
+    regressoes = []
+    for chave, medida in resultados.items():
+        referencia = base.get(chave)
+        if referencia is None:
+            continue
+        for metrica in ('p50_ms', 'pico_mb'):
+            if medida[metrica] > referencia[metrica] * (1 + tolerancia):
+                regressoes.append(f"{chave} {metrica}: {referencia[metrica]} -> {medida[metrica]}")
+    return regressoes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--participantes', type=int, default=60)
+    parser.add_argument('--semanas', type=int, nargs='+', default=[52, 208])
+    parser.add_argument('--repeticoes', type=int, default=20)
+    parser.add_argument('--tolerancia', type=float, default=0.5,
+                        help='piora relativa aceita antes de acusar regressão (padrão: 0.5 = 50%%)')
+    parser.add_argument('--excel', action='store_true',
+                        help='inclui a leitura da planilha inteira (lenta) para comparação')
+    parser.add_argument('--base', default=ARQUIVO_BASE)
+    parser.add_argument('--gravar-base', action='store_true')
+    args = parser.parse_args()
+
+    resultados = executar(args.participantes, args.semanas, args.repeticoes, args.excel)
+
+    if args.gravar_base:
+        os.makedirs(os.path.dirname(args.base), exist_ok=True)
+        with open(args.base, 'w', encoding='utf-8') as f:
+            json.dump(resultados, f, indent=2, sort_keys=True)
+        print(f"\nLinha de base gravada em {args.base}")
+        return
+
+    if not os.path.exists(args.base):
+        print(f"\nSem linha de base em {args.base}; use --gravar-base para criar uma")
+        return
+
+    with open(args.base, encoding='utf-8') as f:
+        base = json.load(f)
+    regressoes = comparar(resultados, base, args.tolerancia)
+    if regressoes:
+        print("\nRegressões em relação à linha de base:")
+        for regressao in regressoes:
+            print(f"  {regressao}")
+        sys.exit(1)
+    print("\nSem regressões em relação à linha de base")
+
+
+if __name__ == '__main__':
+    main()
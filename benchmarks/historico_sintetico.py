@@ -0,0 +1,44 @@
+"""
+Gerador de históricos de frequência sintéticos para os benchmarks.
+
+Produz N participantes × M segundas-feiras × 2 momentos, com a mesma
+distribuição aproximada do histórico real (≈ 75% de presença, dividida
+entre presencial e online).
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+import armazenamento
+
+
+def gerar_historico(participantes=60, semanas=208, inicio='2022-01-03', semente=42):
+    """
+    Gera um DataFrame no formato de armazenamento.COLUNAS.
+    """
+    rng = np.random.default_rng(semente)
+    datas = pd.date_range(inicio, periods=semanas, freq='W-MON')
+    nomes = [f'Participante {i:04d}' for i in range(participantes)]
+
+    grade = pd.MultiIndex.from_product([datas, nomes, [1, 2]], names=['Data', 'Nome', 'Momento'])
+    df = grade.to_frame(index=False)
+
+    sorteio = rng.random(len(df))
+    df['Tipo de presença'] = np.select(
+        [sorteio < 0.25, sorteio < 0.6],
+        ['Ausente', 'Online'],
+        default='Presencial',
+    )
+    df['Frequência'] = np.where(df['Tipo de presença'] == 'Ausente', 'Ausente', 'Presente')
+    df['Data Correta'] = 'Sim'
+    return df[armazenamento.COLUNAS]
+
+
+def criar_banco(df, diretorio, nome='frequencia.db'):
+    """
+    Grava o histórico em um banco SQLite novo dentro de `diretorio` e retorna o caminho.
+    """
+    caminho = os.path.join(diretorio, nome)
+    armazenamento.inserir_registros(df, caminho=caminho)
+    return caminho
@@ -0,0 +1,107 @@
+"""
+Orçamento de tempo de importação do aplicativo.
+
+Mede, em processos novos (sem cache de módulos), quanto tempo os módulos
+importados pelo streamlit_app.py e pelo módulo de cada página levam além
+do próprio Streamlit, que já está carregado quando o servidor executa o
+script. Falha se a abertura do app passar do orçamento. Também informa a
+implementação do protobuf em uso e o custo de serializar as mensagens
+enviadas ao navegador.
+
+Uso (na raiz do projeto):
+    python -m benchmarks.importacao
+    python -m benchmarks.importacao --orcamento 50 --repeticoes 7
+"""
+import argparse
+import ast
+import os
+import statistics
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(RAIZ, 'streamlit_app.py')
+
+_MEDIR = """
+import time
+import streamlit
+inicio = time.perf_counter()
+{importacoes}
+print((time.perf_counter() - inicio) * 1000)
+"""
+
+_PROTOBUF = """
+import time
+from google.protobuf.internal import api_implementation
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+mensagens = []
+for i in range({mensagens}):
+    msg = ForwardMsg()
+    msg.delta.new_element.markdown.body = f'**Livro {{i}}**'
+    msg.metadata.delta_path.extend([0, 1, i])
+    mensagens.append(msg)
+inicio = time.perf_counter()
+dados = [msg.SerializeToString() for msg in mensagens]
+for bruto in dados:
+    ForwardMsg.FromString(bruto)
+print(api_implementation.Type(), (time.perf_counter() - inicio) * 1000)
+"""
+
+
+def _importacoes_do_app():
+    """
+    Módulos importados no nível do streamlit_app.py e os módulos das páginas (PAGINAS).
+    """
+    arvore = ast.parse(open(APP, encoding='utf-8').read())
+    modulos, paginas = [], {}
+    for no in arvore.body:
+        if isinstance(no, ast.Import):
+            modulos += [nome.name for nome in no.names]
+        elif isinstance(no, ast.ImportFrom):
+            modulos.append(no.module)
+        elif isinstance(no, ast.Assign) and any(getattr(alvo, 'id', None) == 'PAGINAS' for alvo in no.targets):
+            paginas = {opcao: modulo for opcao, (modulo, _) in ast.literal_eval(no.value).items()}
+    return list(dict.fromkeys(modulos)), paginas
+
+
+def _executar(codigo):
+    saida = subprocess.run([sys.executable, '-c', codigo], cwd=RAIZ, capture_output=True, text=True, check=True)
+    return saida.stdout.split()
+
+
+def medir_importacao(modulos, repeticoes, ja_importados=()):
+    """
+    Mediana, em ms, do tempo de importar `modulos` depois de `ja_importados`.
+    """
+    codigo = _MEDIR.replace('import streamlit\n', ''.join(f'import {m}\n' for m in ('streamlit', *ja_importados)))
+    codigo = codigo.format(importacoes='\n'.join(f'import {m}' for m in modulos))
+    return statistics.median(float(_executar(codigo)[-1]) for _ in range(repeticoes))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--orcamento', type=float, default=50, help='ms para importar o app além do Streamlit')
+    parser.add_argument('--repeticoes', type=int, default=5)
+    parser.add_argument('--mensagens', type=int, default=5000, help='mensagens na medição do protobuf')
+    args = parser.parse_args()
+
+    modulos, paginas = _importacoes_do_app()
+    abertura = medir_importacao(modulos, args.repeticoes)
+    print(f"Abertura do app ({', '.join(modulos)}): {abertura:.0f} ms (orçamento {args.orcamento:.0f} ms)")
+    for opcao, modulo in paginas.items():
+        tempo = medir_importacao([modulo], args.repeticoes, ja_importados=modulos)
+        print(f"  página '{opcao}' ({modulo}): +{tempo:.0f} ms na primeira abertura")
+
+    implementacao, tempo = _executar(_PROTOBUF.format(mensagens=args.mensagens))
+    print(f"Protobuf '{implementacao}': {args.mensagens} mensagens serializadas e lidas em {float(tempo):.0f} ms")
+    if implementacao == 'python':
+        print("  aviso: protobuf em Python puro; a versão de requirements.txt usa a implementação nativa (upb)")
+
+    if abertura > args.orcamento:
+        print("FALHA: importação do app acima do orçamento")
+        sys.exit(1)
+    print("OK: importação dentro do orçamento")
+
+
+if __name__ == '__main__':
+    main()
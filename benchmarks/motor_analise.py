@@ -0,0 +1,52 @@
+"""
+Compara os motores pandas e Polars na agregação do histórico bruto
+(analise.resumir_registros: leitura do SQLite, filtro e agrupamento).
+
+Uso (na raiz do projeto):
+    python -m benchmarks.motor_analise --participantes 300 --semanas 208
+"""
+import argparse
+import tempfile
+import time
+
+import pandas as pd
+
+import analise
+from benchmarks.historico_sintetico import criar_banco, gerar_historico
+
+
+def melhor_tempo(funcao, repeticoes):
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos), resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--participantes', type=int, default=300)
+    parser.add_argument('--semanas', type=int, default=208)
+    parser.add_argument('--repeticoes', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        historico = gerar_historico(args.participantes, args.semanas)
+        caminho = criar_banco(historico, diretorio)
+        print(f"Histórico sintético: {len(historico)} registros")
+
+        resultados = {}
+        for motor in ('pandas', 'polars'):
+            tempo, resumo = melhor_tempo(
+                lambda: analise.resumir_registros(motor=motor, caminho=caminho), args.repeticoes
+            )
+            resultados[motor] = resumo
+            print(f"{motor:>7}: {tempo * 1000:8.1f} ms ({len(resumo)} linhas de resumo)")
+
+        pd.testing.assert_frame_equal(resultados['pandas'], resultados['polars'])
+        print("Resultados idênticos nos dois motores")
+
+
+if __name__ == '__main__':
+    main()
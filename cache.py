@@ -0,0 +1,165 @@
+"""
+Cache de leituras invalidado por versão dos dados.
+
+Diferente do st.cache_data(ttl=...), as entradas não expiram sozinhas:
+cada leitura compara a versão atual da fonte (assinatura do arquivo ou
+contador do banco) com a versão guardada e só recarrega quando ela muda.
+As escritas também podem invalidar explicitamente. Ao gravar o resultado
+de uma versão nova, as entradas da função guardadas com outra versão são
+descartadas (não seriam mais usadas), e `limite` restringe quantas
+entradas (argumentos distintos, como buscas) cada função mantém.
+
+O estado fica neste módulo (e não no streamlit_app.py, que é reexecutado
+a cada interação), então é compartilhado entre reruns e sessões.
+"""
+import os
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+import pandas as pd
+
+_trava = threading.Lock()
+# nome da função -> OrderedDict {(args, kwargs): (versão, valor)}, das usadas há mais tempo às mais recentes
+_entradas = {}
+_estatisticas = {}
+
+
+def assinatura_arquivo(caminho):
+    """
+    Versão de um arquivo em disco: (mtime em ns, tamanho), ou None se não existir.
+    """
+    try:
+        info = os.stat(caminho)
+    except FileNotFoundError:
+        return None
+    return (info.st_mtime_ns, info.st_size)
+
+
+def _copiar(valor):
+    # Proteger o valor em cache contra alterações feitas por quem o recebe
+    if isinstance(valor, pd.DataFrame):
+        return valor.copy()
+    return valor
+
+
+def cache_por_versao(versao, limite=None):
+    """
+    Decorador que guarda o resultado da função até `versao()` mudar.
+
+    `versao` é chamada a cada leitura e deve ser barata (um os.stat ou
+    uma consulta de uma linha). Com `limite`, a função guarda no máximo
+    essa quantidade de entradas, descartando as usadas há mais tempo.
+    """
+    def decorador(funcao):
+        nome = funcao.__name__
+
+        @wraps(funcao)
+        def envoltorio(*args, **kwargs):
+            chave = (args, tuple(sorted(kwargs.items())))
+            atual = versao()
+
+            with _trava:
+                entradas = _entradas.setdefault(nome, OrderedDict())
+                entrada = entradas.get(chave)
+                contagem = _estatisticas.setdefault(nome, {'acertos': 0, 'falhas': 0})
+                if entrada is not None and entrada[0] == atual:
+                    entradas.move_to_end(chave)
+                    contagem['acertos'] += 1
+                    return _copiar(entrada[1])
+                contagem['falhas'] += 1
+
+            valor = funcao(*args, **kwargs)
+            with _trava:
+                entradas = _entradas.setdefault(nome, OrderedDict())
+                # Entradas de outras versões não voltam a ser usadas
+                for antiga in [c for c, (versao_guardada, _) in entradas.items() if versao_guardada != atual]:
+                    del entradas[antiga]
+                entradas[chave] = (atual, valor)
+                entradas.move_to_end(chave)
+                while limite is not None and len(entradas) > limite:
+                    entradas.popitem(last=False)
+            return _copiar(valor)
+
+        envoltorio.invalidar = lambda: invalidar(nome)
+        return envoltorio
+
+    return decorador
+
+
+class CacheLRU:
+    """
+    Cache com limite de memória: ao passar de `limite_bytes`, descarta as
+    entradas usadas há mais tempo. O tamanho de cada entrada é informado por
+    quem a guarda. Os acertos e falhas aparecem em estatisticas() como `nome`.
+    """
+
+    def __init__(self, nome, limite_bytes):
+        self.nome = nome
+        self.limite_bytes = limite_bytes
+        self._entradas = OrderedDict()
+        self._ocupado = 0
+        with _trava:
+            _estatisticas.setdefault(nome, {'acertos': 0, 'falhas': 0})
+
+    def obter(self, chave):
+        """
+        Valor guardado para a chave (marcado como usado agora), ou None.
+        """
+        with _trava:
+            entrada = self._entradas.get(chave)
+            contagem = _estatisticas[self.nome]
+            if entrada is None:
+                contagem['falhas'] += 1
+                return None
+            self._entradas.move_to_end(chave)
+            contagem['acertos'] += 1
+            return entrada[0]
+
+    def guardar(self, chave, valor, tamanho):
+        """
+        Guarda o valor, descartando as entradas mais antigas até caber no limite.
+        Um valor maior que o limite inteiro não é guardado.
+        """
+        if tamanho > self.limite_bytes:
+            return
+        with _trava:
+            anterior = self._entradas.pop(chave, None)
+            if anterior is not None:
+                self._ocupado -= anterior[1]
+            self._entradas[chave] = (valor, tamanho)
+            self._ocupado += tamanho
+            while self._ocupado > self.limite_bytes:
+                _, (_, tamanho_antigo) = self._entradas.popitem(last=False)
+                self._ocupado -= tamanho_antigo
+
+    def limpar(self):
+        with _trava:
+            self._entradas.clear()
+            self._ocupado = 0
+
+    def ocupacao(self):
+        """
+        (entradas, bytes ocupados).
+        """
+        with _trava:
+            return len(self._entradas), self._ocupado
+
+
+def invalidar(nome=None):
+    """
+    Remove as entradas de uma função (ou de todas, se nome for None).
+    """
+    with _trava:
+        if nome is None:
+            _entradas.clear()
+        else:
+            _entradas.pop(nome, None)
+
+
+def estatisticas():
+    """
+    Retorna as contagens de acertos e falhas por função cacheada.
+    """
+    with _trava:
+        return {nome: dict(contagem) for nome, contagem in _estatisticas.items()}
@@ -0,0 +1,105 @@
+"""
+Calendário do Momento Áureo.
+
+As sessões acontecem toda segunda-feira, então as datas são calculadas
+aritmeticamente em vez de consultadas em uma planilha. Feriados,
+cancelamentos e sessões extras ficam em um pequeno arquivo JSON
+(config.ARQUIVO_CALENDARIO_EXCECOES), por exemplo:
+
+    {"canceladas": ["2024-12-23"], "extras": ["2024-12-26"]}
+"""
+import json
+from datetime import date, datetime, timedelta
+
+import cache
+import config
+import medicao
+
+# Intervalo coberto pelo calendário (antiga planilha segundas_feiras.xlsx)
+PRIMEIRA_SESSAO = date(2022, 1, 3)
+ULTIMA_SESSAO = date(2040, 12, 31)
+
+# Dia da semana das sessões (segunda-feira)
+DIA_DA_SEMANA = 0
+
+
+@medicao.medir
+@cache.cache_por_versao(lambda: cache.assinatura_arquivo(config.ARQUIVO_CALENDARIO_EXCECOES))
+def carregar_excecoes():
+    """
+    Carrega as datas canceladas e extras como conjuntos de date.
+    """
+    try:
+        with open(config.ARQUIVO_CALENDARIO_EXCECOES, encoding='utf-8') as f:
+            dados = json.load(f)
+    except FileNotFoundError:
+        dados = {}
+    except Exception as e:
+        print(f"Erro ao carregar exceções do calendário: {str(e)}")
+        dados = {}
+
+    canceladas = frozenset(date.fromisoformat(d) for d in dados.get('canceladas', []))
+    extras = frozenset(date.fromisoformat(d) for d in dados.get('extras', []))
+    return canceladas, extras
+
+
+def para_data(dia):
+    """
+    Converte date, datetime, Timestamp ou texto dd/mm/aaaa em date.
+    """
+    if isinstance(dia, str):
+        return datetime.strptime(dia, '%d/%m/%Y').date()
+    if isinstance(dia, datetime):
+        return dia.date()
+    return dia
+
+
+def _sessao_regular(dia, canceladas):
+    return (
+        dia.weekday() == DIA_DA_SEMANA
+        and PRIMEIRA_SESSAO <= dia <= ULTIMA_SESSAO
+        and dia not in canceladas
+    )
+
+
+def eh_dia_momento(dia):
+    """
+    Verifica se a data é um dia de Momento Áureo, em O(1).
+    """
+    dia = para_data(dia)
+    canceladas, extras = carregar_excecoes()
+    return dia in extras or _sessao_regular(dia, canceladas)
+
+
+def listar_sessoes(inicio=PRIMEIRA_SESSAO, fim=ULTIMA_SESSAO):
+    """
+    Lista as datas de sessão entre inicio e fim (inclusive), em O(k).
+    """
+    inicio, fim = para_data(inicio), para_data(fim)
+    canceladas, extras = carregar_excecoes()
+
+    # Primeira segunda-feira dentro do intervalo
+    dia = max(inicio, PRIMEIRA_SESSAO)
+    dia += timedelta(days=(DIA_DA_SEMANA - dia.weekday()) % 7)
+    ultimo = min(fim, ULTIMA_SESSAO)
+
+    sessoes = []
+    while dia <= ultimo:
+        if dia not in canceladas:
+            sessoes.append(dia)
+        dia += timedelta(days=7)
+
+    # Sessões extras que ainda não estão na lista
+    adicionais = [d for d in extras if inicio <= d <= fim and not _sessao_regular(d, canceladas)]
+    if adicionais:
+        sessoes = sorted(sessoes + adicionais)
+    return sessoes
+
+
+@medicao.medir
+@cache.cache_por_versao(lambda: cache.assinatura_arquivo(config.ARQUIVO_CALENDARIO_EXCECOES))
+def listar_sessoes_formatadas(inicio=PRIMEIRA_SESSAO, fim=ULTIMA_SESSAO):
+    """
+    Lista as datas de sessão como texto dd/mm/aaaa (calculada uma vez por versão das exceções).
+    """
+    return [dia.strftime('%d/%m/%Y') for dia in listar_sessoes(inicio, fim)]
@@ -0,0 +1,208 @@
+"""
+Capas dos livros: armazenamento pelo conteúdo e miniaturas.
+
+As capas enviadas são gravadas em config.UPLOAD_DIR com o nome igual ao
+hash SHA-256 do conteúdo, então a mesma imagem é guardada uma só vez e
+dois livros com "capa.jpg" não se sobrescrevem. A tabela `capas` do banco
+conta quantos livros usam cada arquivo; o arquivo só é apagado quando o
+último livro que o usa é removido.
+
+A grade de livros exibe miniaturas JPEG reduzidas em vez das imagens
+originais. Cada miniatura é gravada em config.MINIATURAS_DIR com o nome
+derivado do conteúdo da imagem de origem (hash SHA-256), então uma capa
+alterada gera uma nova miniatura na próxima exibição, e capas idênticas
+compartilham a mesma miniatura.
+"""
+import glob
+import hashlib
+import io
+import os
+import tempfile
+import threading
+from collections import Counter
+from contextlib import closing
+
+from PIL import Image, ImageOps
+
+import armazenamento
+import cache
+import config
+
+_trava = threading.Lock()
+# caminho da capa -> (assinatura do arquivo, hash do conteúdo)
+_hashes = {}
+
+
+def hash_arquivo(caminho):
+    """
+    Hash SHA-256 do conteúdo do arquivo, recalculado só quando o arquivo muda.
+    """
+    assinatura = cache.assinatura_arquivo(caminho)
+    if assinatura is None:
+        return None
+
+    with _trava:
+        conhecido = _hashes.get(caminho)
+    if conhecido is not None and conhecido[0] == assinatura:
+        return conhecido[1]
+
+    resumo = hashlib.sha256()
+    with open(caminho, 'rb') as f:
+        for bloco in iter(lambda: f.read(1 << 16), b''):
+            resumo.update(bloco)
+    valor = resumo.hexdigest()
+
+    with _trava:
+        _hashes[caminho] = (assinatura, valor)
+    return valor
+
+
+def _gravar_atomico(destino, conteudo):
+    # Gravar em arquivo temporário e renomear: nenhum leitor vê o arquivo pela metade
+    os.makedirs(os.path.dirname(destino), exist_ok=True)
+    descritor, temporario = tempfile.mkstemp(dir=os.path.dirname(destino), suffix='.tmp')
+    try:
+        with os.fdopen(descritor, 'wb') as f:
+            f.write(conteudo)
+        os.replace(temporario, destino)
+    except BaseException:
+        os.remove(temporario)
+        raise
+
+
+def guardar_capa(conteudo, nome_original, caminho_banco=None):
+    """
+    Guarda a imagem pelo hash do conteúdo e conta mais uma referência a ela.
+    Retorna o caminho do arquivo (o já existente, se a mesma imagem já foi enviada).
+    """
+    hash_conteudo = hashlib.sha256(conteudo).hexdigest()
+    extensao = os.path.splitext(nome_original)[1].lower() or '.jpg'
+
+    with closing(armazenamento.conectar(caminho_banco)) as con:
+        with con:
+            con.execute('BEGIN IMMEDIATE')
+            existente = con.execute(
+                'SELECT caminho FROM capas WHERE hash = ? ORDER BY caminho LIMIT 1', (hash_conteudo,)
+            ).fetchone()
+            if existente is not None and os.path.exists(existente[0]):
+                caminho = existente[0]
+            else:
+                caminho = os.path.join(config.UPLOAD_DIR, f'{hash_conteudo}{extensao}')
+                if not os.path.exists(caminho):
+                    _gravar_atomico(caminho, conteudo)
+            con.execute("""
+                INSERT INTO capas (caminho, hash, referencias) VALUES (?, ?, 1)
+                ON CONFLICT (caminho) DO UPDATE SET referencias = referencias + 1
+            """, (caminho, hash_conteudo))
+    return caminho
+
+
+def liberar_capa(caminho, caminho_banco=None):
+    """
+    Conta uma referência a menos à capa e apaga o arquivo (e as miniaturas)
+    quando nenhum livro a usa mais. Retorna True se o arquivo foi apagado.
+    """
+    if not caminho:
+        return False
+
+    with closing(armazenamento.conectar(caminho_banco)) as con:
+        with con:
+            con.execute('BEGIN IMMEDIATE')
+            linha = con.execute('SELECT hash, referencias FROM capas WHERE caminho = ?', (caminho,)).fetchone()
+            if linha is None:
+                # Capa sem registro: não há como saber se outro livro a usa, então fica
+                return False
+            hash_conteudo, referencias = linha
+            if referencias > 1:
+                con.execute('UPDATE capas SET referencias = referencias - 1 WHERE caminho = ?', (caminho,))
+                return False
+            con.execute('DELETE FROM capas WHERE caminho = ?', (caminho,))
+            outra_copia = con.execute('SELECT 1 FROM capas WHERE hash = ?', (hash_conteudo,)).fetchone()
+            # Apagar ainda com a trava de escrita: um guardar_capa da mesma imagem
+            # espera o commit e, sem o registro, grava o arquivo de novo
+            if os.path.exists(caminho):
+                os.remove(caminho)
+            if outra_copia is None:
+                for arquivo in glob.glob(caminho_miniatura(hash_conteudo, '*')):
+                    os.remove(arquivo)
+    return True
+
+
+def adotar_capas(caminhos, caminho_banco=None):
+    """
+    Registra as capas já citadas no catálogo mas ainda sem contagem (gravadas
+    antes do armazenamento pelo conteúdo), com uma referência por livro.
+    """
+    contagens = Counter(caminho for caminho in caminhos if isinstance(caminho, str) and caminho)
+    if not contagens:
+        return 0
+
+    with closing(armazenamento.conectar(caminho_banco)) as con:
+        registrados = {
+            caminho for (caminho,) in con.execute(
+                f"SELECT caminho FROM capas WHERE caminho IN ({', '.join('?' * len(contagens))})", list(contagens)
+            )
+        }
+        novos = [
+            (caminho, hash_arquivo(caminho), referencias)
+            for caminho, referencias in contagens.items()
+            if caminho not in registrados and os.path.exists(caminho)
+        ]
+        if novos:
+            with con:
+                con.execute('BEGIN IMMEDIATE')
+                con.executemany("""
+                    INSERT INTO capas (caminho, hash, referencias) VALUES (?, ?, ?)
+                    ON CONFLICT (caminho) DO NOTHING
+                """, novos)
+    return len(novos)
+
+
+def caminho_miniatura(hash_conteudo, largura=None):
+    """
+    Caminho da miniatura de uma imagem, endereçado pelo hash do conteúdo.
+    """
+    largura = largura or config.LARGURA_MINIATURA
+    return os.path.join(config.MINIATURAS_DIR, hash_conteudo[:2], f'{hash_conteudo}_{largura}.jpg')
+
+
+def gerar_miniatura(origem, destino, largura=None):
+    """
+    Reduz a imagem para a largura indicada e grava como JPEG comprimido.
+    """
+    largura = largura or config.LARGURA_MINIATURA
+    with Image.open(origem) as imagem:
+        imagem = ImageOps.exif_transpose(imagem)
+        imagem.thumbnail((largura, largura * 3))
+
+        # JPEG não tem transparência: aplicar sobre fundo branco
+        if imagem.mode in ('RGBA', 'LA', 'P'):
+            imagem = imagem.convert('RGBA')
+            fundo = Image.new('RGB', imagem.size, 'white')
+            fundo.paste(imagem, mask=imagem.getchannel('A'))
+            imagem = fundo
+        elif imagem.mode != 'RGB':
+            imagem = imagem.convert('RGB')
+
+        saida = io.BytesIO()
+        imagem.save(saida, 'JPEG', quality=config.QUALIDADE_MINIATURA, optimize=True, progressive=True)
+    _gravar_atomico(destino, saida.getvalue())
+    return destino
+
+
+def miniatura(caminho_capa, largura=None):
+    """
+    Caminho da miniatura da capa, gerada na primeira vez (ou quando a capa muda).
+    Retorna None se a capa não existir ou não puder ser lida.
+    """
+    try:
+        hash_conteudo = hash_arquivo(caminho_capa)
+        if hash_conteudo is None:
+            return None
+        destino = caminho_miniatura(hash_conteudo, largura)
+        if not os.path.exists(destino):
+            gerar_miniatura(caminho_capa, destino, largura)
+        return destino
+    except Exception as e:
+        print(f"Erro ao gerar miniatura de {caminho_capa}: {str(e)}")
+        return None
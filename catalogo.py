@@ -0,0 +1,131 @@
+"""
+Catálogo de livros em SQLite.
+
+Cada livro tem um id estável; incluir e remover um livro grava só a sua
+linha, em vez de regravar a planilha inteira. A tabela `versao_livros`
+conta as escritas, para invalidar os caches de leitura. Na primeira vez,
+os livros de config.ARQUIVO_LIVROS (planilha usada antes) são importados.
+"""
+import os
+import re
+from contextlib import closing
+
+import pandas as pd
+
+import armazenamento
+import capas
+import config
+
+# Colunas do DataFrame do catálogo usado pelo aplicativo
+COLUNAS = ['ID', 'Nome do livro', 'Autor', 'Ano', 'Capa']
+
+_SQL_NOVA_VERSAO = 'UPDATE versao_livros SET valor = valor + 1 WHERE id = 1'
+
+_catalogos_verificados = set()
+
+
+def conectar(caminho=None):
+    """
+    Abre uma conexão com o banco, importando a planilha de livros na primeira vez.
+    """
+    caminho = caminho or config.ARQUIVO_BANCO
+    con = armazenamento.conectar(caminho)
+    if caminho not in _catalogos_verificados:
+        _importar_planilha(con, caminho)
+        _catalogos_verificados.add(caminho)
+    return con
+
+
+def _importar_planilha(con, caminho):
+    """
+    Importa livros.xlsx se o catálogo nunca foi gravado (versão 0).
+    """
+    with con:
+        con.execute('BEGIN IMMEDIATE')
+        if con.execute('SELECT valor FROM versao_livros WHERE id = 1').fetchone()[0] > 0:
+            return
+        if os.path.exists(config.ARQUIVO_LIVROS):
+            df = pd.read_excel(config.ARQUIVO_LIVROS, engine='openpyxl')
+            df = df.dropna(subset=['Nome do livro'])
+            con.executemany(
+                'INSERT INTO livros (nome, autor, ano, capa) VALUES (?, ?, ?, ?)',
+                [
+                    (str(nome), '' if pd.isna(autor) else str(autor), None if pd.isna(ano) else int(ano),
+                     capa if isinstance(capa, str) else '')
+                    for nome, autor, ano, capa in df[['Nome do livro', 'Autor', 'Ano', 'Capa']].itertuples(index=False)
+                ],
+            )
+        con.execute(_SQL_NOVA_VERSAO)
+
+    # Contar as referências das capas gravadas antes do armazenamento pelo conteúdo
+    capas.adotar_capas([capa for (capa,) in con.execute('SELECT capa FROM livros')], caminho)
+
+
+def versao(caminho=None):
+    """
+    Contador de escritas do catálogo.
+    """
+    with closing(conectar(caminho)) as con:
+        return con.execute('SELECT valor FROM versao_livros WHERE id = 1').fetchone()[0]
+
+
+def _filtro_busca(busca):
+    # Cláusula WHERE da busca por título ou autor (os curingas do LIKE valem como texto)
+    if not busca:
+        return '', []
+    termo = '%' + re.sub(r'([\\%_])', r'\\\1', busca.strip()) + '%'
+    return " WHERE nome LIKE ? ESCAPE '\\' OR autor LIKE ? ESCAPE '\\'", [termo, termo]
+
+
+def contar_livros(busca=None, caminho=None):
+    """
+    Quantidade de livros, opcionalmente só os com `busca` no título ou autor.
+    """
+    where, parametros = _filtro_busca(busca)
+    with closing(conectar(caminho)) as con:
+        return con.execute(f'SELECT COUNT(*) FROM livros{where}', parametros).fetchone()[0]
+
+
+def carregar_livros(busca=None, limite=None, deslocamento=0, caminho=None):
+    """
+    Lista os livros em ordem de título, opcionalmente só os com `busca` no título ou autor.
+    Com `limite`, retorna só uma página: `limite` livros a partir da posição `deslocamento`.
+    """
+    where, parametros = _filtro_busca(busca)
+    sql = ('SELECT id AS "ID", nome AS "Nome do livro", autor AS "Autor", ano AS "Ano", capa AS "Capa" '
+           f'FROM livros{where} ORDER BY nome COLLATE NOCASE, id')
+    if limite is not None:
+        sql += ' LIMIT ? OFFSET ?'
+        parametros = parametros + [limite, deslocamento]
+    with closing(conectar(caminho)) as con:
+        return pd.read_sql_query(sql, con, params=parametros)
+
+
+def adicionar_livro(nome, autor, ano, capa='', caminho=None):
+    """
+    Inclui um livro e retorna o seu id.
+    """
+    with closing(conectar(caminho)) as con:
+        with con:
+            cursor = con.execute(
+                'INSERT INTO livros (nome, autor, ano, capa) VALUES (?, ?, ?, ?)',
+                (nome, autor, ano, capa or ''),
+            )
+            con.execute(_SQL_NOVA_VERSAO)
+            return cursor.lastrowid
+
+
+def remover_livro(id_livro, caminho=None):
+    """
+    Remove o livro pelo id e libera a sua capa. Retorna False se o livro não existir.
+    """
+    with closing(conectar(caminho)) as con:
+        with con:
+            linha = con.execute('SELECT capa FROM livros WHERE id = ?', (id_livro,)).fetchone()
+            if linha is None:
+                return False
+            con.execute('DELETE FROM livros WHERE id = ?', (id_livro,))
+            con.execute(_SQL_NOVA_VERSAO)
+
+    capas.liberar_capa(linha[0], caminho)
+    return True
@@ -0,0 +1,58 @@
+import os
+from datetime import date
+from pathlib import Path
+
+# Configurar diretórios
+BASE_DIR = Path(__file__).resolve().parent
+DATA_DIR = os.path.join(BASE_DIR, 'data')
+UPLOAD_DIR = os.path.join(DATA_DIR, 'capas')
+
+# Miniaturas das capas (geradas a partir das imagens em UPLOAD_DIR)
+MINIATURAS_DIR = os.path.join(DATA_DIR, 'miniaturas')
+LARGURA_MINIATURA = 300  # o dobro da largura exibida, para telas de alta densidade
+QUALIDADE_MINIATURA = 80
+
+# Variáveis de ambiente opcionais em um arquivo .env na raiz do projeto
+try:
+    from dotenv import load_dotenv
+    load_dotenv(os.path.join(BASE_DIR, '.env'))
+except ImportError:
+    pass
+
+# Banco SQLite com o histórico de frequência
+ARQUIVO_BANCO = os.path.join(DATA_DIR, 'frequencia.db')
+
+# Planilha de frequência (usada apenas para importação/exportação)
+ARQUIVO_FREQUENCIA_EXCEL = os.path.join(DATA_DIR, 'lista_frequencia_ma.xlsx')
+
+# Planilha legada com o histórico de 2022 a 2024 (importada com import_data.py historico)
+ARQUIVO_HISTORICO_EXCEL = os.path.join(DATA_DIR, 'historico_22_23_24.xlsx')
+
+# Planilhas de apoio (participantes e livros são importados para o banco na primeira vez)
+ARQUIVO_PARTICIPANTES = os.path.join(DATA_DIR, 'participantes_momentos.xlsx')
+ARQUIVO_CALENDARIO_EXCECOES = os.path.join(DATA_DIR, 'calendario_excecoes.json')
+ARQUIVO_LIVROS = os.path.join(DATA_DIR, 'livros.xlsx')
+
+# Motor da agregação do histórico bruto (analise.resumir_registros): 'pandas' ou 'polars'
+MOTOR_ANALISE = os.environ.get('FREQUENCIA_MOTOR', 'pandas')
+
+# Modo de depuração: mostra estatísticas de cache na barra lateral
+DEBUG = os.environ.get('FREQUENCIA_DEBUG', '0') == '1'
+
+# Início do 2º Momento: registros anteriores não entram na análise do 2º Momento
+INICIO_SEGUNDO_MOMENTO = date.fromisoformat(os.environ.get('FREQUENCIA_INICIO_SEGUNDO_MOMENTO', '2024-04-01'))
+
+# Livros exibidos por página na grade de livros
+LIVROS_POR_PAGINA = int(os.environ.get('FREQUENCIA_LIVROS_POR_PAGINA', '12'))
+
+# Memória máxima do cache de gráficos da análise (figuras Plotly já montadas)
+MEMORIA_FIGURAS_MB = float(os.environ.get('FREQUENCIA_MEMORIA_FIGURAS_MB', '32'))
+
+# Medição de tempo das etapas de cada execução do app (ver medicao.py)
+MEDICAO = os.environ.get('FREQUENCIA_MEDICAO', '0') == '1'
+ARQUIVO_MEDICOES = os.path.join(DATA_DIR, 'medicoes.jsonl')
+
+# Perfil por amostragem de uma execução, pedido na barra lateral (ver perfil.py)
+PERFIL = os.environ.get('FREQUENCIA_PERFIL', '0') == '1'
+INTERVALO_PERFIL_MS = float(os.environ.get('FREQUENCIA_PERFIL_INTERVALO_MS', '1'))
+PERFIS_DIR = os.path.join(DATA_DIR, 'perfis')
@@ -0,0 +1,313 @@
+"""
+Gráficos da análise de frequência (Plotly).
+
+As figuras montadas ficam em um cache LRU com limite de memória
+(config.MEMORIA_FIGURAS_MB), pela chave (versão dos dados, gráfico,
+argumentos, filtros). Quem chama informa em `filtros` os filtros que
+produziram o DataFrame (anos, nome, meses...); sem `filtros`, a figura é
+montada sem cache. Voltar a uma aba ou reexecutar a página reaproveita a
+figura já montada e validada.
+"""
+from functools import wraps
+
+import plotly.graph_objects as go
+import plotly.io as pio
+import streamlit as st
+
+import analise
+import armazenamento
+import cache
+import config
+import medicao
+
+# Estilo comum dos gráficos do app, registrado como template do Plotly.
+# Os gráficos partem do layout deste template (em vez de template='momento_aureo')
+# porque o tema do Streamlit sobrescreve as fontes e cores de layout.template no
+# navegador; valores no próprio layout prevalecem sobre o tema.
+pio.templates['momento_aureo'] = go.layout.Template(layout=dict(
+    font=dict(family="Arial", size=12),
+    title=dict(font=dict(size=20, family="Arial Black")),
+    height=400,
+    plot_bgcolor='#F5F5DC',  # Fundo bege
+    paper_bgcolor='white',
+    bargap=0.2,
+    legend=dict(
+        orientation="h",
+        yanchor="bottom",
+        y=1.02,
+        xanchor="right",
+        x=1
+    ),
+    xaxis=dict(
+        title="",
+        tickfont=dict(family="Arial", size=12)
+    ),
+    yaxis=dict(
+        title=dict(
+            text="Percentual (%)",
+            font=dict(size=14, family="Arial")
+        ),
+        tickfont=dict(family="Arial", size=12),
+        tickformat='.1f',
+        ticksuffix='%'
+    ),
+))
+
+# Cores de cada tipo de presença
+CORES_TIPOS = {
+    'Presencial': '#2E8B57',  # Verde
+    'Online': '#4682B4',      # Azul
+    'Ausente': '#FF4B4B'      # Vermelho
+}
+
+# Rótulo das barras: o valor formatado no navegador, sem uma lista de textos por barra
+_ROTULO_PERCENTUAL = '<b>%{y:.1f}%</b>'
+
+# Memória de uma figura sem os dados (objetos do Plotly), medida com tracemalloc
+_BYTES_FIXOS_FIGURA = 48 * 1024
+# Memória por valor dos dados: os traços guardam arrays numpy (8 bytes por
+# número ou referência a texto, medido com tracemalloc); 16 cobre as listas
+_BYTES_POR_VALOR = 16
+# Atributos dos traços com um valor por ponto
+_CAMPOS_DADOS = ('x', 'y', 'labels', 'values', 'customdata')
+
+_figuras = cache.CacheLRU('figuras', int(config.MEMORIA_FIGURAS_MB * 1024 * 1024))
+
+
+def figura_em_cache(funcao):
+    """
+    Decorador dos gráficos: reaproveita a figura montada para os mesmos
+    dados (versão do banco + `filtros`) e os mesmos demais argumentos.
+    """
+    @wraps(funcao)
+    def envoltorio(df, *args, filtros=None):
+        if filtros is None:
+            return funcao(df, *args)
+
+        chave = (armazenamento.versao_dados(), funcao.__name__, args, filtros)
+        fig = _figuras.obter(chave)
+        if fig is None:
+            fig = funcao(df, *args)
+            # Figuras com erro (None) não são guardadas, para o erro voltar a aparecer
+            if fig is not None:
+                _figuras.guardar(chave, fig, _tamanho_figura(fig))
+        return fig
+
+    return envoltorio
+
+
+def _tamanho_figura(fig):
+    # Estimativa pelo número de valores dos traços, sem serializar a figura
+    valores = sum(
+        len(trace[campo])
+        for trace in fig.data
+        for campo in _CAMPOS_DADOS
+        if campo in trace and trace[campo] is not None
+    )
+    return _BYTES_FIXOS_FIGURA + valores * _BYTES_POR_VALOR
+
+
+def nova_figura(titulo, **layout):
+    """
+    Figura vazia com o estilo do template do app, o título e os ajustes de layout do gráfico.
+    """
+    fig = go.Figure(layout=pio.templates['momento_aureo'].layout)
+    fig.update_layout(title_text=titulo, **layout)
+    return fig
+
+
+@medicao.medir
+@figura_em_cache
+def create_monthly_percentage_chart(df_subset, momento_label):
+    """
+    Cria um gráfico de barras empilhadas mostrando o percentual de frequência por mês,
+    a partir do resumo pré-agregado de frequência.
+    """
+    try:
+        # Calcular percentuais de presença e ausência por mês (em ordem cronológica)
+        monthly_stats = analise.percentual_mensal(df_subset)
+        
+        # Criar figura
+        fig = nova_figura(
+            f'Percentual de Frequência por Mês - {momento_label}',
+            barmode='stack',
+            xaxis=dict(
+                type='category',
+                tickangle=90,  # Texto na vertical
+                tickmode='linear',  # Um rótulo por mês
+                dtick=1,
+                tickprefix='<b>',
+                ticksuffix='</b>'
+            ),
+            yaxis=dict(range=[0, 100]),
+            showlegend=True
+        )
+        
+        # Adicionar barras de presença e ausência
+        barras = (
+            ('Presente', 'Frequência', 'Presença', '#2E8B57'),  # Verde
+            ('Ausente', 'Ausência', 'Ausência', '#FF4B4B'),     # Vermelho
+        )
+        for nome, coluna, rotulo, cor in barras:
+            fig.add_trace(go.Bar(
+                name=nome,
+                x=monthly_stats.index,
+                y=monthly_stats[coluna].round(1),
+                marker_color=cor,
+                texttemplate=_ROTULO_PERCENTUAL,
+                textposition='auto',
+                hovertemplate=f'Mês/Ano: %{{x}}<br>{rotulo}: %{{y:.1f}}%<extra></extra>'
+            ))
+        
+        return fig
+        
+    except Exception as e:
+        st.error(f"Erro ao gerar gráfico: {str(e)}")
+        return None
+
+
+@medicao.medir
+@figura_em_cache
+def plot_presence_type_distribution(df_subset, momento_label):
+    """
+    Cria um gráfico de barras mostrando a distribuição dos tipos de presença,
+    a partir do resumo pré-agregado de frequência.
+    """
+    try:
+        # Definir ordem desejada dos tipos de presença
+        ordem_tipos = list(CORES_TIPOS)
+        
+        # Calcular a contagem e percentual de cada tipo de presença
+        presence_counts = analise.contar_tipos(df_subset).reindex(ordem_tipos).fillna(0).astype(int)
+        total = presence_counts.sum()
+        presence_percentages = (presence_counts / total * 100).round(1)
+        
+        # Criar gráfico
+        fig = nova_figura(
+            f'Distribuição de Tipo de Presença - {momento_label}',
+            xaxis=dict(
+                ticktext=[f'<span style="color: {cor}"><b>{tipo}</b></span>' for tipo, cor in CORES_TIPOS.items()],
+                tickvals=ordem_tipos,
+                tickangle=90  # Texto na vertical
+            ),
+            margin=dict(t=100, b=50)  # Ajustar margens
+        )
+        
+        # Adicionar barras com percentuais
+        fig.add_trace(go.Bar(
+            x=ordem_tipos,
+            y=presence_percentages,
+            texttemplate=_ROTULO_PERCENTUAL,
+            textposition='auto',
+            marker_color=list(CORES_TIPOS.values()),
+            hovertemplate='%{x}<br>Percentual: %{y:.1f}%<br>Quantidade: %{customdata} registros<extra></extra>',
+            customdata=presence_counts.values,
+            showlegend=False
+        ))
+        
+        return fig
+        
+    except Exception as e:
+        st.error(f"Erro ao gerar gráfico: {str(e)}")
+        return None
+
+
+@medicao.medir
+@figura_em_cache
+def create_yearly_comparison_chart(comparacao):
+    """
+    Cria um gráfico de barras agrupadas com o percentual de presença de cada ano,
+    total e por momento (tabela de analise.comparacao_anual).
+    """
+    try:
+        # Cores de cada série (mesma paleta dos outros gráficos)
+        color_map = {
+            'Total': '#DAA520',       # Dourado
+            '1º Momento': '#2E8B57',  # Verde
+            '2º Momento': '#4682B4'   # Azul
+        }
+        anos = [str(ano) for ano in comparacao.index]
+        
+        fig = nova_figura(
+            'Percentual de Presença por Ano',
+            barmode='group',
+            xaxis=dict(type='category'),
+            yaxis=dict(range=[0, 100])
+        )
+        # Anos sem registros no momento (NaN) ficam sem barra e sem rótulo
+        for serie, cor in color_map.items():
+            fig.add_trace(go.Bar(
+                name=serie,
+                x=anos,
+                y=comparacao[serie].round(1),
+                marker_color=cor,
+                texttemplate=_ROTULO_PERCENTUAL,
+                textposition='auto',
+                hovertemplate=f'Ano: %{{x}}<br>{serie}: %{{y:.1f}}%<extra></extra>'
+            ))
+        
+        return fig
+        
+    except Exception as e:
+        st.error(f"Erro ao gerar gráfico: {str(e)}")
+        return None
+
+
+@medicao.medir
+@figura_em_cache
+def create_year_over_year_chart(mensal, momento_label):
+    """
+    Cria um gráfico de linhas com o percentual de presença mês a mês, uma linha por ano
+    (tabela de analise.frequencia_mensal_por_ano).
+    """
+    try:
+        meses = ["Jan", "Fev", "Mar", "Abr", "Mai", "Jun", "Jul", "Ago", "Set", "Out", "Nov", "Dez"]
+        
+        fig = nova_figura(f'Presença Mensal por Ano - {momento_label}', yaxis=dict(range=[0, 100]))
+        for ano in mensal.columns:
+            fig.add_trace(go.Scatter(
+                name=str(ano),
+                x=meses,
+                y=mensal[ano].round(1),
+                mode='lines+markers',
+                connectgaps=False,
+                hovertemplate=f'{ano} - %{{x}}<br>Presença: %{{y:.1f}}%<extra></extra>'
+            ))
+        
+        return fig
+        
+    except Exception as e:
+        st.error(f"Erro ao gerar gráfico: {str(e)}")
+        return None
+
+
+@medicao.medir
+@figura_em_cache
+def create_pie_chart(df_subset, momento_label):
+    """
+    Cria um gráfico de pizza mostrando a distribuição dos tipos de presença,
+    a partir do resumo pré-agregado de frequência.
+    """
+    try:
+        # Calcular contagem por tipo de presença
+        tipo_presenca_counts = analise.contar_tipos(df_subset).sort_values(ascending=False)
+        
+        # Criar gráfico (percentuais calculados pelo Plotly a partir das contagens)
+        fig = nova_figura(f'Distribuição de Tipo de Presença - {momento_label}', showlegend=True)
+        
+        fig.add_trace(go.Pie(
+            labels=tipo_presenca_counts.index,
+            values=tipo_presenca_counts.values,
+            hole=0.4,
+            marker_colors=[CORES_TIPOS.get(tipo, '#808080') for tipo in tipo_presenca_counts.index],
+            texttemplate='<b>%{percent:.1%}</b>',
+            textposition='auto',
+            hovertemplate='%{label}<br>Percentual: %{percent:.1%}<br>Quantidade: %{value} registros<extra></extra>',
+            insidetextorientation='radial'
+        ))
+        
+        return fig
+        
+    except Exception as e:
+        st.error(f"Erro ao gerar gráfico: {str(e)}")
+        return None
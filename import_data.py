@@ -1,26 +1,191 @@
-
-
-
-from datetime import datetime
-import openpyxl
-import pandas as pd
-import streamlit as st
-from datetime import datetime
-
-
-def gerar_segundas_feiras():
-    """
-    Gera um DataFrame com todas as datas que caem em uma segunda-feira
-    no formato dd/mm/yy entre 2022 e 2030.
-    """
-    # Definir a data inicial e final
-    start_date = datetime(2022, 1, 1)
-    end_date = datetime(2040, 12, 31)
-
-    # Gerar todas as segundas-feiras no intervalo
-    mondays = pd.date_range(start=start_date, end=end_date, freq='W-MON')
-
-    # Criar um DataFrame com o formato desejado
-    df_mondays = pd.DataFrame({'Datas': mondays.strftime('%d/%m/%Y')})
-    st.write(df_mondays)
-    df_mondays.to_excel('data/segundas_feiras.xlsx', index=False)
+import argparse
+import re
+import time
+from datetime import date, datetime
+
+import openpyxl
+import pandas as pd
+from openpyxl.utils.datetime import from_excel
+
+import analise
+import armazenamento
+import calendario
+import config
+import participantes
+
+# Linhas lidas da planilha por transação na importação de históricos
+TAMANHO_LOTE = 5000
+
+# Grafias aceitas para os valores de texto da planilha
+_FREQUENCIAS = {'presente': 'Presente', 'ausente': 'Ausente'}
+_TIPOS_PRESENCA = {'presencial': 'Presencial', 'online': 'Online', 'ausente': 'Ausente'}
+
+
+def importar_frequencia(arquivo=config.ARQUIVO_FREQUENCIA_EXCEL):
+    """
+    Importa uma planilha de frequência para o banco SQLite.
+    """
+    total = armazenamento.importar_excel(arquivo)
+    print(f"{total} registros importados de {arquivo}")
+
+
+def exportar_frequencia(arquivo=config.ARQUIVO_FREQUENCIA_EXCEL):
+    """
+    Exporta o histórico do banco SQLite para uma planilha Excel.
+    """
+    total = armazenamento.exportar_excel(arquivo)
+    print(f"{total} registros exportados para {arquivo}")
+
+
+def reconstruir_resumo():
+    """
+    Recalcula o resumo de frequência a partir do histórico bruto (motor de config.MOTOR_ANALISE).
+    """
+    inicio = time.perf_counter()
+    total = analise.reconstruir_resumo()
+    print(f"Resumo recalculado (motor {config.MOTOR_ANALISE}): {total} linhas "
+          f"em {time.perf_counter() - inicio:.2f} s")
+
+
+def importar_participantes(arquivo=config.ARQUIVO_PARTICIPANTES):
+    """
+    Sincroniza os momentos do cadastro de participantes com a planilha.
+    """
+    total = participantes.importar_planilha(arquivo)
+    print(f"{total} participantes em algum momento conforme {arquivo}")
+
+
+def _texto(valor):
+    # Texto sem espaços nas pontas e com espaços internos simples; vazio vira None
+    if valor is None:
+        return None
+    texto = ' '.join(str(valor).split())
+    return texto or None
+
+
+def normalizar_data(valor):
+    """
+    Converte a data da planilha (data, número serial do Excel ou texto) em date.
+    """
+    if isinstance(valor, datetime):
+        return valor.date()
+    if isinstance(valor, date):
+        return valor
+    if isinstance(valor, (int, float)):
+        return from_excel(valor).date()
+    texto = _texto(valor)
+    for formato in ('%d/%m/%Y', '%Y-%m-%d', '%d/%m/%y', '%Y-%m-%d %H:%M:%S'):
+        try:
+            return datetime.strptime(texto, formato).date()
+        except (TypeError, ValueError):
+            pass
+    return None
+
+
+def normalizar_momento(valor):
+    """
+    Converte o momento (1, 2.0, '2', '1º Momento'...) em 1 ou 2.
+    """
+    if isinstance(valor, (int, float)):
+        momento = int(valor)
+    else:
+        numero = re.search(r'\d', _texto(valor) or '')
+        momento = int(numero.group()) if numero else None
+    return momento if momento in (1, 2) else None
+
+
+def normalizar_linha(linha):
+    """
+    Normaliza uma linha {coluna: valor} da planilha no formato de armazenamento.COLUNAS.
+    Retorna None para linhas inválidas (sem data, nome, momento ou frequência).
+    """
+    data = normalizar_data(linha.get('Data'))
+    nome = armazenamento.normalizar_nome(linha.get('Nome'))
+    momento = normalizar_momento(linha.get('Momento'))
+    frequencia = _texto(linha.get('Frequência'))
+    if data is None or nome is None or momento is None or frequencia is None:
+        return None
+
+    tipo = _texto(linha.get('Tipo de presença'))
+    data_correta = _texto(linha.get('Data Correta'))
+    return (
+        datetime.combine(data, datetime.min.time()),
+        nome,
+        momento,
+        _FREQUENCIAS.get(frequencia.lower(), frequencia),
+        _TIPOS_PRESENCA.get(tipo.lower(), tipo) if tipo else None,
+        data_correta or ('Sim' if calendario.eh_dia_momento(data) else 'Não'),
+    )
+
+
+def ler_planilha_em_lotes(arquivo, tamanho_lote=TAMANHO_LOTE):
+    """
+    Lê a primeira aba da planilha em modo somente leitura (sem carregá-la inteira),
+    gerando (linhas normalizadas, linhas inválidas) a cada `tamanho_lote` linhas.
+    """
+    livro = openpyxl.load_workbook(arquivo, read_only=True, data_only=True)
+    try:
+        linhas = livro.worksheets[0].iter_rows(values_only=True)
+        cabecalho = [_texto(coluna) for coluna in next(linhas, ())]
+        faltando = {'Data', 'Nome', 'Momento', 'Frequência'} - set(cabecalho)
+        if faltando:
+            raise ValueError(f"Colunas ausentes em {arquivo}: {', '.join(sorted(faltando))}")
+
+        lote, invalidas = [], 0
+        for valores in linhas:
+            if not any(valor is not None for valor in valores):
+                continue
+            linha = normalizar_linha(dict(zip(cabecalho, valores)))
+            if linha is None:
+                invalidas += 1
+            else:
+                lote.append(linha)
+            if len(lote) + invalidas >= tamanho_lote:
+                yield lote, invalidas
+                lote, invalidas = [], 0
+        if lote or invalidas:
+            yield lote, invalidas
+    finally:
+        livro.close()
+
+
+def importar_historico(arquivo=config.ARQUIVO_HISTORICO_EXCEL, tamanho_lote=TAMANHO_LOTE, caminho=None):
+    """
+    Importa uma planilha legada de histórico em lotes, sem substituir registros já gravados.
+    """
+    inicio = time.perf_counter()
+    lidas = gravadas = invalidas = 0
+    for lote, invalidas_lote in ler_planilha_em_lotes(arquivo, tamanho_lote):
+        df = pd.DataFrame(lote, columns=armazenamento.COLUNAS)
+        gravadas += armazenamento.inserir_registros(df, caminho=caminho, substituir=False)
+        lidas += len(lote) + invalidas_lote
+        invalidas += invalidas_lote
+
+    duracao = time.perf_counter() - inicio
+    repetidas = lidas - invalidas - gravadas
+    print(f"{arquivo}: {lidas} linhas lidas, {gravadas} registros novos, "
+          f"{repetidas} já existentes ou repetidos, {invalidas} inválidas "
+          f"em {duracao:.2f} s ({lidas / duracao if duracao else 0:.0f} linhas/s)")
+    return gravadas
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Importação/exportação da frequência do Momento Áureo')
+    parser.add_argument('acao', choices=['importar', 'exportar', 'historico', 'participantes', 'resumo'])
+    parser.add_argument('arquivos', nargs='*',
+                        help='planilhas (padrão: lista_frequencia_ma.xlsx; historico_22_23_24.xlsx para "historico"; '
+                             'participantes_momentos.xlsx para "participantes")')
+    parser.add_argument('--lote', type=int, default=TAMANHO_LOTE, help='linhas por transação na ação "historico"')
+    args = parser.parse_args()
+
+    if args.acao == 'historico':
+        for arquivo in args.arquivos or [config.ARQUIVO_HISTORICO_EXCEL]:
+            importar_historico(arquivo, args.lote)
+    elif args.acao == 'resumo':
+        reconstruir_resumo()
+    elif args.acao == 'participantes':
+        importar_participantes(*args.arquivos[:1])
+    elif args.acao == 'importar':
+        importar_frequencia(*args.arquivos[:1])
+    else:
+        exportar_frequencia(*args.arquivos[:1])
@@ -0,0 +1,141 @@
+"""
+Medição de tempo dos caminhos críticos do app (opcional).
+
+Com FREQUENCIA_MEDICAO=1 (config.MEDICAO), as funções decoradas com
+@medir registram a duração e a quantidade de linhas do resultado na
+execução (rerun) em andamento. Ao fim de cada execução, o traço completo
+(página, tempo total, etapas) é gravado como uma linha JSON em
+config.ARQUIVO_MEDICOES. O tempo total menos o das etapas é o gasto pelo
+próprio Streamlit (widgets, envio dos elementos) e pelo código não medido.
+
+Desligada, @medir devolve a função sem alteração: nenhum custo extra.
+"""
+import json
+import threading
+import time
+from datetime import datetime
+from functools import wraps
+
+import config
+
+_trava_arquivo = threading.Lock()
+# Execução em andamento em cada thread (o Streamlit executa cada sessão na sua thread)
+_local = threading.local()
+
+
+def _linhas(valor):
+    # Tamanho do resultado: linhas de DataFrame/Series, itens de listas, pontos de figuras
+    if valor is None or isinstance(valor, (str, bytes, int, float)):
+        return None
+    if isinstance(valor, tuple):
+        return _linhas(valor[0]) if valor else None
+    dados = getattr(valor, 'data', None)
+    if isinstance(dados, tuple):  # go.Figure: soma dos pontos das séries
+        return sum(_pontos(serie) for serie in dados)
+    try:
+        return len(valor)
+    except TypeError:
+        return None
+
+
+def _pontos(serie):
+    # Pontos de uma série do Plotly: x (barras, linhas) ou labels/values (pizza)
+    for campo in ('x', 'labels', 'values'):
+        pontos = getattr(serie, campo, None)
+        if pontos is not None:
+            return len(pontos)
+    return 0
+
+
+def medir(funcao=None, nome=None):
+    """
+    Decorador que mede a função na execução em andamento (se a medição estiver ligada).
+    Uso: @medir ou @medir(nome='...').
+    """
+    if funcao is None:
+        return lambda f: medir(f, nome)
+    if not config.MEDICAO:
+        return funcao
+
+    rotulo = nome or f'{funcao.__module__}.{funcao.__name__}'
+
+    @wraps(funcao)
+    def envoltorio(*args, **kwargs):
+        execucao = getattr(_local, 'execucao', None)
+        if execucao is None:
+            return funcao(*args, **kwargs)
+
+        etapa = {'nome': rotulo, 'nivel': execucao['nivel']}
+        execucao['etapas'].append(etapa)
+        execucao['nivel'] += 1
+        inicio = time.perf_counter()
+        try:
+            resultado = funcao(*args, **kwargs)
+        except Exception as e:
+            etapa['erro'] = type(e).__name__
+            raise
+        finally:
+            etapa['ms'] = round((time.perf_counter() - inicio) * 1000, 2)
+            execucao['nivel'] -= 1
+        try:
+            etapa['linhas'] = _linhas(resultado)
+        except Exception:
+            etapa['linhas'] = None  # a medição nunca altera o resultado da função
+        return resultado
+
+    return envoltorio
+
+
+def iniciar_execucao(**dados):
+    """
+    Começa o traço de uma execução do script.
+    """
+    if not config.MEDICAO:
+        return
+    _local.execucao = {
+        'inicio': datetime.now().isoformat(timespec='milliseconds'),
+        'relogio': time.perf_counter(),
+        'nivel': 0,
+        'etapas': [],
+        **dados,
+    }
+
+
+def anotar(**dados):
+    """
+    Acrescenta informações (página, filtros...) ao traço em andamento.
+    """
+    execucao = getattr(_local, 'execucao', None)
+    if execucao is not None:
+        execucao.update(dados)
+
+
+def resumo_execucao():
+    """
+    Traço da execução em andamento até agora: total, medido, restante e etapas.
+    Retorna None se a medição estiver desligada.
+    """
+    execucao = getattr(_local, 'execucao', None)
+    if execucao is None:
+        return None
+    total = (time.perf_counter() - execucao['relogio']) * 1000
+    # Só as etapas de primeiro nível: as internas já estão no tempo de quem as chamou
+    medido = sum(etapa.get('ms', 0) for etapa in execucao['etapas'] if etapa['nivel'] == 0)
+    traco = {chave: valor for chave, valor in execucao.items() if chave not in ('relogio', 'nivel')}
+    traco.update(total_ms=round(total, 2), medido_ms=round(medido, 2), restante_ms=round(total - medido, 2))
+    return traco
+
+
+def finalizar_execucao():
+    """
+    Encerra o traço da execução e o grava em config.ARQUIVO_MEDICOES.
+    """
+    traco = resumo_execucao()
+    _local.execucao = None
+    if traco is None:
+        return None
+    linha = json.dumps(traco, ensure_ascii=False, default=str)
+    with _trava_arquivo:
+        with open(config.ARQUIVO_MEDICOES, 'a', encoding='utf-8') as f:
+            f.write(linha + '\n')
+    return traco
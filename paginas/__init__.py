@@ -0,0 +1,7 @@
+"""
+Páginas do aplicativo Streamlit.
+
+Cada módulo é importado pelo streamlit_app.py só quando a sua página é
+aberta, então as bibliotecas pesadas de uma página (Plotly na análise,
+Pillow nos livros) não atrasam a abertura das demais.
+"""
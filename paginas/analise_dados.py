@@ -0,0 +1,234 @@
+"""
+Página de análise de dados de frequência.
+"""
+import streamlit as st
+
+import analise
+import armazenamento
+import graficos
+from paginas import dados
+
+
+def analise_dados():
+    st.title("Análise de Dados de Frequência")
+    
+    # Anos com registros (o mais recente vem selecionado)
+    anos_com_dados = dados.carregar_anos()
+    if not anos_com_dados:
+        st.warning("Não há dados para análise.")
+        return
+    
+    # Sidebar: seleção do modo de análise
+    modo_analise = st.sidebar.selectbox(
+        "Selecione o modo de análise:",
+        ["Análise de todos participantes", "Filtrar por Nome"]
+    )
+    
+    # Sidebar: seleção dos anos analisados
+    anos = st.sidebar.multiselect(
+        "Selecione os anos:",
+        anos_com_dados,
+        default=anos_com_dados[-1:]
+    )
+    if not anos:
+        st.info("Selecione ao menos um ano para a análise.")
+        return
+    anos = tuple(sorted(anos))
+    
+    # Carrega só os anos selecionados do resumo pré-agregado (pessoa, momento, mês e tipo de presença)
+    df = dados.carregar_resumo_frequencia(anos)
+    
+    if df.empty:
+        st.warning("Não há dados para análise.")
+        return
+    
+    # Filtrar resumo por momento (o 2º Momento começou em config.INICIO_SEGUNDO_MOMENTO)
+    df_m1 = analise.filtrar(df, momento=1)
+    df_m2 = analise.filtrar(df, momento=2)
+    
+    if modo_analise == "Análise de todos participantes":
+        st.header("Análise de todos participantes")
+        
+        # Criar tabs para os diferentes momentos
+        tab1, tab2, tab3, tab4 = st.tabs(["1º Momento", "2º Momento", "Indicadores Anuais", "Comparação entre Anos"])
+        
+        # --- 1º Momento ---
+        with tab1:
+            if df_m1.empty:
+                st.info("Não há registros para o 1º Momento.")
+            else:
+                st.subheader("Percentual de Frequência por Mês")
+                fig_monthly_m1 = graficos.create_monthly_percentage_chart(df_m1, "1º Momento", filtros=(anos, 1))
+                if fig_monthly_m1:
+                    st.plotly_chart(fig_monthly_m1, use_container_width=True, key="monthly_m1_tab1")
+                
+                st.subheader("Distribuição de Tipo de Presença")
+                fig_tipo_m1 = graficos.plot_presence_type_distribution(df_m1, "1º Momento", filtros=(anos, 1))
+                if fig_tipo_m1:
+                    st.plotly_chart(fig_tipo_m1, use_container_width=True, key="presence_m1_tab1")
+        
+        # --- 2º Momento ---
+        with tab2:
+            if df_m2.empty:
+                st.warning('Talvez a pessoa não participe do momento.')
+                st.info("Não há registros para o 2º Momento.")
+            else:
+                st.subheader("Percentual de Frequência por Mês")
+                fig_monthly_m2 = graficos.create_monthly_percentage_chart(df_m2, "2º Momento", filtros=(anos, 2))
+                if fig_monthly_m2:
+                    st.plotly_chart(fig_monthly_m2, use_container_width=True, key="monthly_m2_tab2")
+                
+                st.subheader("Distribuição de Tipo de Presença")
+                fig_tipo_m2 = graficos.plot_presence_type_distribution(df_m2, "2º Momento", filtros=(anos, 2))
+                if fig_tipo_m2:
+                    st.plotly_chart(fig_tipo_m2, use_container_width=True, key="presence_m2_tab2")
+        
+        # --- Indicadores Anuais ---
+        with tab3:
+            for ano in anos:
+                st.subheader(f"Indicadores Anuais - {ano}")
+                
+                # Percentual de presença total e por momento
+                frequencia = analise.indicadores_anuais(df, ano)['Frequência']
+                
+                # Criar três colunas para os indicadores
+                col1, col2, col3 = st.columns(3)
+                
+                with col1:
+                    st.markdown("**Percentual de Presença Total**")
+                    st.metric("", f"{frequencia['Total']:.1f}%")
+                
+                with col2:
+                    st.markdown("**Presença 1º Momento**")
+                    st.metric("", f"{frequencia['1º Momento']:.1f}%")
+                
+                with col3:
+                    st.markdown("**Presença 2º Momento**")
+                    st.metric("", f"{frequencia['2º Momento']:.1f}%")
+        
+        # --- Comparação entre anos (calculada sobre o resumo) ---
+        with tab4:
+            if len(anos) < 2:
+                st.info("Selecione dois ou mais anos na barra lateral para compará-los.")
+            else:
+                fig_anos = graficos.create_yearly_comparison_chart(analise.comparacao_anual(df), filtros=(anos,))
+                if fig_anos:
+                    st.plotly_chart(fig_anos, use_container_width=True, key="yearly_tab4")
+                
+                for momento, rotulo in ((1, "1º Momento"), (2, "2º Momento")):
+                    mensal = analise.frequencia_mensal_por_ano(df, momento)
+                    if mensal.empty:
+                        continue
+                    fig_mensal = graficos.create_year_over_year_chart(mensal, rotulo, filtros=(anos, momento))
+                    if fig_mensal:
+                        st.plotly_chart(fig_mensal, use_container_width=True, key=f"yoy_m{momento}_tab4")
+            
+    elif modo_analise == "Filtrar por Nome":
+        # Sidebar: seleção do Nome (lista já ordenada do índice por participante)
+        series_pessoas = dados.carregar_series_pessoas(anos)
+        nomes = list(series_pessoas)
+        nome_selecionado = st.sidebar.selectbox("Selecione o Nome:", nomes)
+        
+        if nome_selecionado:
+            st.header(f"Análise para {nome_selecionado}")
+            
+            # Adicionar filtros na sidebar
+            st.sidebar.markdown("### Filtros")
+            
+            # Seletor de momento
+            momento_selecionado = st.sidebar.radio(
+                "Selecione o Momento:",
+                ["Geral", "1º Momento", "2º Momento"],
+                horizontal=True
+            )
+            
+            # Seletor de ano (entre os anos selecionados em que a pessoa tem registros)
+            anos_disponiveis = sorted(series_pessoas[nome_selecionado][None]['Ano'].unique())
+            ano_selecionado = st.sidebar.selectbox(
+                "Selecione o Ano:",
+                anos_disponiveis,
+                index=len(anos_disponiveis)-1
+            )
+            
+            # Filtrar meses disponíveis para o ano selecionado
+            df_ano = df[df['Ano'] == ano_selecionado]
+            meses_disponiveis = sorted(df_ano['Mês'].unique())
+            
+            # Slider de meses
+            mes_inicio, mes_fim = st.sidebar.select_slider(
+                "Selecione o Intervalo de Meses:",
+                options=meses_disponiveis,
+                value=(meses_disponiveis[0], meses_disponiveis[-1]),
+                format_func=lambda x: [
+                    "Janeiro", "Fevereiro", "Março", "Abril", "Maio", "Junho",
+                    "Julho", "Agosto", "Setembro", "Outubro", "Novembro", "Dezembro"
+                ][x-1]
+            )
+            
+            # Resumo pré-calculado da pessoa no momento, recortado no intervalo de meses
+            momento = {"1º Momento": 1, "2º Momento": 2}.get(momento_selecionado)
+            df_pessoa = analise.recortar_periodo(
+                series_pessoas[nome_selecionado][momento],
+                armazenamento.periodo(ano_selecionado, mes_inicio),
+                armazenamento.periodo(ano_selecionado, mes_fim),
+            )
+            
+            if df_pessoa.empty:
+                st.warning("Não há dados para o período selecionado.")
+            else:
+                # Título do período
+                meses_pt = [
+                    "Janeiro", "Fevereiro", "Março", "Abril", "Maio", "Junho",
+                    "Julho", "Agosto", "Setembro", "Outubro", "Novembro", "Dezembro"
+                ]
+                mes_inicio_nome = meses_pt[mes_inicio-1]
+                mes_fim_nome = meses_pt[mes_fim-1]
+                
+                titulo = f"Indicadores do Período ({mes_inicio_nome} a {mes_fim_nome} de {ano_selecionado})"
+                if momento_selecionado != "Geral":
+                    titulo += f" - {momento_selecionado}"
+                st.subheader(titulo)
+                
+                # Métricas principais
+                indicadores = analise.indicadores(df_pessoa)
+                
+                col1, col2, col3 = st.columns(3)
+                
+                with col1:
+                    st.metric("Percentual de Presença", f"{indicadores['Frequência']:.1f}%",
+                              f"{indicadores['Registros']} registros totais")
+                
+                with col2:
+                    st.metric("Presencial + Online", f"{indicadores['Percentual Presencial + Online']:.1f}%",
+                              f"{indicadores['Presencial + Online']} registros")
+                
+                with col3:
+                    st.metric("Ausente", f"{indicadores['Percentual Ausente']:.1f}%",
+                              f"{indicadores['Ausente']} registros")
+                
+                # Gráficos (em cache pelos filtros que definem df_pessoa)
+                filtros_pessoa = (anos, nome_selecionado, momento, int(ano_selecionado), int(mes_inicio), int(mes_fim))
+                st.markdown("#### Frequência Mensal")
+                fig_monthly = graficos.create_monthly_percentage_chart(df_pessoa, momento_selecionado, filtros=filtros_pessoa)
+                if fig_monthly:
+                    st.plotly_chart(fig_monthly, use_container_width=True)
+                st.markdown("#### Tipos de Presença")
+                fig_tipo = graficos.plot_presence_type_distribution(df_pessoa, momento_selecionado, filtros=filtros_pessoa)
+                if fig_tipo:
+                    st.plotly_chart(fig_tipo, use_container_width=True)
+                
+                # Registros individuais (o histórico bruto só é lido quando pedido)
+                if st.checkbox("Mostrar registros do período"):
+                    historico, indice = dados.carregar_historico_por_nome(anos)
+                    registros = analise.recortar_periodo(
+                        analise.linhas_pessoa(historico, indice, nome_selecionado),
+                        armazenamento.periodo(ano_selecionado, mes_inicio),
+                        armazenamento.periodo(ano_selecionado, mes_fim),
+                    )
+                    if momento is not None:
+                        registros = registros[registros['Momento'] == momento]
+                    st.dataframe(
+                        registros[['Data', 'Momento', 'Frequência', 'Tipo de presença']],
+                        hide_index=True,
+                        use_container_width=True,
+                    )
@@ -0,0 +1,87 @@
+"""
+Leituras do histórico de frequência usadas pelas páginas, em cache por versão dos dados.
+"""
+import pandas as pd
+
+import analise
+import armazenamento
+import cache
+import medicao
+
+# Seleções de anos guardadas em cache por leitura (as do histórico bruto copiam o histórico inteiro)
+_ANOS_EM_CACHE = 4
+
+
+@medicao.medir
+@cache.cache_por_versao(armazenamento.versao_dados, limite=_ANOS_EM_CACHE)
+def carregar_dados_frequencia(anos=None):
+    """
+    Carrega os dados de frequência do banco SQLite (todos os anos ou só os anos pedidos).
+    """
+    try:
+        df = armazenamento.carregar_registros(anos=anos)
+        
+        if df.empty:
+            print("Aviso: Nenhum dado encontrado no arquivo de frequência")
+            return pd.DataFrame()
+            
+        return df
+    except Exception as e:
+        print(f"Erro ao carregar dados de frequência: {str(e)}")
+        return pd.DataFrame()
+
+
+@medicao.medir
+@cache.cache_por_versao(armazenamento.versao_dados, limite=_ANOS_EM_CACHE)
+def carregar_resumo_frequencia(anos=None):
+    """
+    Carrega o resumo pré-agregado de frequência (pessoa, momento, mês e tipo),
+    de todos os anos ou só dos anos pedidos.
+    """
+    try:
+        return armazenamento.carregar_resumo(anos=anos)
+    except Exception as e:
+        print(f"Erro ao carregar resumo de frequência: {str(e)}")
+        return pd.DataFrame(columns=armazenamento.COLUNAS_RESUMO)
+
+
+@medicao.medir
+@cache.cache_por_versao(armazenamento.versao_dados, limite=_ANOS_EM_CACHE)
+def carregar_historico_por_nome(anos=None):
+    """
+    Histórico bruto ordenado por Nome e Data, com o índice nome -> intervalo de linhas.
+    """
+    return analise.indexar_por_nome(carregar_dados_frequencia(anos), 'Data')
+
+
+@medicao.medir
+@cache.cache_por_versao(armazenamento.versao_dados, limite=_ANOS_EM_CACHE)
+def carregar_series_pessoas(anos=None):
+    """
+    Resumo de cada participante por momento, pré-calculado uma vez por versão dos dados.
+    """
+    return analise.series_por_pessoa(carregar_resumo_frequencia(anos))
+
+
+@medicao.medir
+@cache.cache_por_versao(armazenamento.versao_dados)
+def carregar_anos():
+    """
+    Anos com registros de frequência.
+    """
+    try:
+        return armazenamento.anos_disponiveis()
+    except Exception as e:
+        print(f"Erro ao carregar anos de frequência: {str(e)}")
+        return []
+
+
+def invalidar():
+    """
+    Descarta as leituras em cache depois de uma gravação.
+    """
+    carregar_dados_frequencia.invalidar()
+    carregar_resumo_frequencia.invalidar()
+    carregar_series_pessoas.invalidar()
+    carregar_historico_por_nome.invalidar()
+    carregar_anos.invalidar()
@@ -0,0 +1,215 @@
+"""
+Página de lançamento de frequência.
+"""
+from datetime import date, datetime
+
+import pandas as pd
+import streamlit as st
+
+import armazenamento
+import cache
+import calendario
+import medicao
+import participantes
+from paginas import dados
+
+# Opções de marcação na planilha de frequência
+OPCOES_PRESENCA = ['Presencial', 'Online', 'Ausente']
+
+# Listas de participantes guardadas em cache (cada momento e data é uma entrada)
+_LISTAS_EM_CACHE = 16
+
+
+@medicao.medir
+@cache.cache_por_versao(participantes.versao, limite=_LISTAS_EM_CACHE)
+def carregar_participantes(momento, data):
+    """
+    Participantes (ID e Nome) do momento ativos na data (aaaa-mm-dd), em ordem de nome.
+    """
+    try:
+        return participantes.carregar_participantes(momento, data)[['ID', 'Nome']]
+    except Exception as e:
+        print(f"Erro ao carregar lista de participantes: {str(e)}")
+        return pd.DataFrame(columns=['ID', 'Nome'])
+
+
+@medicao.medir
+def salvar_frequencia(data_registro, momento, df_freq):
+    """
+    Grava os registros da sessão no banco (um reenvio substitui os anteriores).
+    """
+    try:
+        # Converter a data de registro para datetime
+        data_registro_dt = datetime.strptime(data_registro, '%d/%m/%Y')
+        
+        # Adicionar colunas necessárias ao DataFrame
+        df_novos = df_freq.copy()
+        df_novos['Data'] = data_registro  # Mantém o formato original dd/mm/yyyy no DataFrame
+        
+        # Converter momento para número
+        momento_num = 1 if momento == '1º Momento' else 2
+        df_novos['Momento'] = momento_num
+        
+        # Validar se a data é um dia de Momento Áureo
+        df_novos['Data Correta'] = 'Sim' if calendario.eh_dia_momento(data_registro_dt) else 'Não'
+        
+        # Gravar apenas as linhas da sessão; chaves repetidas são substituídas
+        armazenamento.inserir_registros(df_novos)
+        
+        # Invalidar cache para forçar recarregamento dos dados
+        dados.invalidar()
+        
+        st.sidebar.success('Frequência registrada com sucesso!')
+            
+    except Exception as e:
+        st.error(f"Erro ao salvar frequência: {str(e)}")
+
+
+def frequencia_reg():
+    if "page_configured" not in st.session_state:
+        st.set_page_config(page_title="Registrar frequência reunião", layout="centered")
+        st.session_state["page_configured"] = True
+    
+    option_freq = st.sidebar.selectbox('Selecione uma opção:',
+                                     ['Selecione', 
+                                      'Lançar frequência na Segunda-Feira',
+                                      'Lançar frequência em outra data'])
+
+    if option_freq == 'Lançar frequência na Segunda-Feira':
+        lancar_frequencia_dia()
+    elif option_freq == 'Lançar frequência em outra data':
+        lancar_frequencia_data()
+
+
+def lancar_frequencia_dia():
+    st.title('Lançar frequência na Segunda-Feira')
+    st.markdown("---")
+    
+    data_hoje = datetime.now().date()
+    hoje_str = data_hoje.strftime('%d/%m/%Y')
+    
+    if not calendario.eh_dia_momento(data_hoje):
+        st.error('Hoje não é um dia de Momento Áureo.')
+        return
+    
+    option_momento = st.sidebar.selectbox('Selecione o momento:', 
+                                ['Selecione',
+                                 '1º Momento', 
+                                 '2º Momento'])
+    
+    if option_momento == '1º Momento':
+        pri_momento(hoje_str)
+    elif option_momento == '2º Momento':
+        sec_momento(hoje_str)
+
+
+def lancar_frequencia_data():
+    """Define o layout para lançar frequência em uma data específica."""
+    st.title("Lançar frequência em outra data")
+    st.markdown("---")
+    
+    try:
+        # Datas de sessão a partir de 2025 (calculadas pelo calendário)
+        datas_futuras = calendario.listar_sessoes_formatadas(inicio=date(2025, 1, 1))
+        
+        if not datas_futuras:
+            st.error("Não há datas disponíveis a partir de 2025")
+            return
+            
+        # Seleção da data - mostrar as datas formatadas para dd/mm/yyyy
+        data_selecionada = st.sidebar.selectbox(
+            'Selecione a data:', 
+            ['Selecione'] + datas_futuras
+        )
+        
+        # Só mostra a seleção do momento se uma data foi selecionada
+        if data_selecionada and data_selecionada != 'Selecione':
+            option_momento = st.sidebar.selectbox('Selecione o momento:', 
+                                    ['Selecione',
+                                     '1º Momento', 
+                                     '2º Momento'],
+                                    key='momento_outra_data')  # Chave única para evitar conflito
+            
+            if option_momento == '1º Momento':
+                pri_momento(data_selecionada)
+            elif option_momento == '2º Momento':
+                sec_momento(data_selecionada)
+        
+        # Mostrar aviso se hoje não é dia do Momento Áureo
+        if not calendario.eh_dia_momento(datetime.now().date()):
+            st.warning("Hoje não é um dia de Momento Áureo")
+                    
+    except Exception as e:
+        st.error(f"Erro ao processar as datas: {str(e)}")
+        print(f"Erro detalhado: {str(e)}")
+
+
+def registros_da_planilha(marcacoes):
+    """
+    Converte as marcações da planilha (Nome, Presença, indexada pelo ID do
+    participante) em registros de frequência. Participantes sem marcação são ignorados.
+    """
+    marcados = marcacoes[marcacoes['Presença'].isin(OPCOES_PRESENCA)]
+    return pd.DataFrame({
+        'ID': marcados.index,
+        'Nome': marcados['Nome'],
+        'Frequência': marcados['Presença'].where(marcados['Presença'] == 'Ausente', 'Presente'),
+        'Tipo de presença': marcados['Presença'],
+    }).reset_index(drop=True)
+
+
+def lancar_momento(titulo, momento, data_especifica=None):
+    """
+    Planilha de frequência de um momento em um único formulário: as marcações
+    ficam no navegador e são enviadas de uma vez, sem rerun a cada clique.
+    """
+    if data_especifica:
+        titulo += f' - Data: {data_especifica}'
+    st.title(titulo)
+    st.markdown("---")
+
+    data_registro = data_especifica if data_especifica else datetime.now().strftime('%d/%m/%Y')
+    numero_momento = 1 if momento == '1º Momento' else 2
+
+    # Participantes do momento ativos na data da sessão
+    lista = carregar_participantes(
+        numero_momento, datetime.strptime(data_registro, '%d/%m/%Y').strftime('%Y-%m-%d')
+    )
+    if lista.empty:
+        st.error("Não foi possível carregar a lista de participantes")
+        return
+
+    st.sidebar.warning('Lembre-se de marcar a presença de todos os participantes antes de enviar.')
+
+    with st.form(key=f'form_{numero_momento}_{data_registro}'):
+        marcacoes = st.data_editor(
+            pd.DataFrame({'Nome': lista['Nome'].to_numpy(), 'Presença': None}, index=pd.Index(lista['ID'], name='ID')),
+            column_config={
+                'Nome': st.column_config.TextColumn('Nome', disabled=True),
+                'Presença': st.column_config.SelectboxColumn(
+                    'Presença',
+                    options=OPCOES_PRESENCA,
+                    help='Presencial, Online ou Ausente',
+                ),
+            },
+            hide_index=True,
+            use_container_width=True,
+            height=min(35 * (len(lista) + 1) + 3, 800),
+            key=f'planilha_{numero_momento}_{data_registro}',
+        )
+        enviar = st.form_submit_button('Enviar')
+
+    if enviar:
+        df_freq = registros_da_planilha(marcacoes)
+        if df_freq.empty:
+            st.warning('Nenhuma presença foi marcada.')
+        else:
+            salvar_frequencia(data_registro, momento, df_freq)
+
+
+def pri_momento(data_especifica=None):
+    lancar_momento('Lançar Frequência - Corrente - 18h às 19h - 1º Momento', '1º Momento', data_especifica)
+
+
+def sec_momento(data_especifica=None):
+    lancar_momento('Lançar Frequência - Corrente - 19h às 20h - 2º Momento', '2º Momento', data_especifica)
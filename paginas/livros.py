@@ -0,0 +1,132 @@
+"""
+Página do catálogo de livros.
+"""
+import pandas as pd
+import streamlit as st
+
+import capas
+import catalogo
+import cache
+import config
+import medicao
+
+# Buscas/páginas guardadas em cache (cada texto buscado é uma entrada)
+_BUSCAS_EM_CACHE = 64
+
+
+@medicao.medir
+@cache.cache_por_versao(catalogo.versao, limite=_BUSCAS_EM_CACHE)
+def carregar_livros(busca=None, pagina=1, por_pagina=None):
+    """
+    Carrega uma página dos livros do catálogo, opcionalmente filtrados por título ou autor.
+    """
+    por_pagina = por_pagina or config.LIVROS_POR_PAGINA
+    return catalogo.carregar_livros(busca or None, limite=por_pagina, deslocamento=(pagina - 1) * por_pagina)
+
+
+@medicao.medir
+@cache.cache_por_versao(catalogo.versao, limite=_BUSCAS_EM_CACHE)
+def contar_livros(busca=None):
+    """
+    Conta os livros do catálogo, opcionalmente filtrados por título ou autor.
+    """
+    return catalogo.contar_livros(busca or None)
+
+
+def livros():
+    st.title("Livros")
+    st.markdown("### Lista de Livros para Estudo")
+    
+    # Carregar dados existentes
+    busca = st.text_input('Buscar por título ou autor').strip()
+    try:
+        # Só a página exibida é lida do banco (e só as suas miniaturas são geradas)
+        total_livros = contar_livros(busca)
+        total_paginas = max(1, -(-total_livros // config.LIVROS_POR_PAGINA))
+        pagina = 1
+        if total_paginas > 1:
+            pagina = int(st.number_input(f'Página (de {total_paginas})', min_value=1, max_value=total_paginas,
+                                         value=1, step=1))
+        df_livros = carregar_livros(busca, pagina)
+    except Exception as e:
+        st.error(f"Erro ao carregar catálogo de livros: {str(e)}")
+        total_livros = 0
+        df_livros = pd.DataFrame(columns=catalogo.COLUNAS)
+    
+    # Formulário na sidebar
+    with st.sidebar:
+        st.markdown("### Adicionar Novo Livro")
+        with st.form(key='livros'):
+            livro_nome = st.text_input('Nome do livro')
+            livro_autor = st.text_input('Autor')
+            livro_ano = st.number_input('Ano', min_value=1900, max_value=2100, value=2024)
+            livro_capa = st.file_uploader('Upload da Capa', type=['png', 'jpg', 'jpeg'])
+        
+            submit = st.form_submit_button('Adicionar Livro')
+            
+            if submit and livro_nome and livro_autor:  # Validação básica
+                try:
+                    # Salvar imagem se fornecida (pelo conteúdo: a mesma imagem é guardada uma vez)
+                    imagem_path = ''
+                    if livro_capa is not None:
+                        imagem_path = capas.guardar_capa(livro_capa.getvalue(), livro_capa.name)
+                        
+                        # Gerar a miniatura exibida na grade
+                        capas.miniatura(imagem_path)
+                
+                    # Adicionar novo livro (só a sua linha é gravada)
+                    catalogo.adicionar_livro(livro_nome, livro_autor, int(livro_ano), imagem_path)
+                    st.success('Livro adicionado com sucesso!')
+                    st.experimental_rerun()
+                except Exception as e:
+                    st.error(f"Erro ao salvar livro: {str(e)}")
+        
+        # Seção para remover livros (entre os exibidos na página)
+        if not df_livros.empty:
+            st.markdown("### Remover Livro")
+            with st.form(key='remover_livro'):
+                # Opções pelo id do livro, exibidas com nome e autor
+                rotulos = dict(zip(df_livros['ID'].tolist(), df_livros['Nome do livro'] + ' (' + df_livros['Autor'] + ')'))
+                livro_selecionado = st.selectbox('Selecione o livro para remover:', list(rotulos),
+                                                 format_func=rotulos.get)
+                confirmar = st.form_submit_button('Remover Livro')
+                
+                if confirmar:
+                    try:
+                        # Remover o livro e liberar a capa (o arquivo só é apagado se nenhum outro livro a usa)
+                        catalogo.remover_livro(int(livro_selecionado))
+                        st.success('Livro removido com sucesso!')
+                        st.rerun()
+                    except Exception as e:
+                        st.error(f"Erro ao remover livro: {str(e)}")
+    
+    # Mostrar lista de livros no conteúdo principal
+    if df_livros.empty:
+        if busca:
+            st.info('Nenhum livro encontrado para a busca.')
+        else:
+            st.info('Não há livros cadastrados. Use o formulário na barra lateral para adicionar.')
+    else:
+        inicio = (pagina - 1) * config.LIVROS_POR_PAGINA
+        st.caption(f"Livros {inicio + 1}–{inicio + len(df_livros)} de {total_livros}")
+        
+        # Criar grid para exibição dos livros da página
+        registros = df_livros.to_dict('records')
+        for i in range(0, len(registros), 3):  # Mostrar 3 livros por linha
+            cols = st.columns(3)
+            for livro, col in zip(registros[i:i + 3], cols):
+                with col:
+                    st.markdown("---")
+                    if livro['Capa']:
+                        try:
+                            # Miniatura reduzida (a capa original só se a miniatura falhar)
+                            st.image(capas.miniatura(livro['Capa']) or livro['Capa'], width=150)
+                        except:
+                            st.markdown("📚")  # Emoji como fallback
+                    else:
+                        st.markdown("📚")
+                    
+                    st.markdown(f"**{livro['Nome do livro']}**")
+                    st.markdown(f"_{livro['Autor']}_")
+                    if pd.notna(livro['Ano']):
+                        st.markdown(f"Ano: {int(livro['Ano'])}")
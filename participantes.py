@@ -0,0 +1,165 @@
+"""
+Cadastro de participantes em SQLite.
+
+Cada participante tem um id estável, a indicação dos momentos de que
+participa e o período em que está ativo (início e fim, vazios quando em
+aberto). A frequência é gravada pelo id (ver armazenamento.py), então
+renomear alguém não divide o seu histórico. A tabela
+`versao_participantes` conta as alterações do cadastro, para invalidar os
+caches de leitura. Na primeira vez, os momentos vêm de
+config.ARQUIVO_PARTICIPANTES (colunas 1_momento e 2_momento).
+"""
+import os
+from contextlib import closing
+
+import pandas as pd
+
+import armazenamento
+import config
+
+# Colunas do DataFrame do cadastro usado pelo aplicativo
+COLUNAS = ['ID', 'Nome', '1º Momento', '2º Momento', 'Início', 'Fim']
+
+# Coluna da tabela e da planilha de cada momento
+_COLUNAS_MOMENTO = {1: 'primeiro_momento', 2: 'segundo_momento'}
+_COLUNAS_PLANILHA = {1: '1_momento', 2: '2_momento'}
+
+_SQL_NOVA_VERSAO = 'UPDATE versao_participantes SET valor = valor + 1 WHERE id = 1'
+# Contador de versão do histórico (ver armazenamento.versao_dados)
+_SQL_NOVA_VERSAO_DADOS = 'UPDATE versao SET valor = valor + 1 WHERE id = 1'
+
+_cadastros_verificados = set()
+
+
+def conectar(caminho=None):
+    """
+    Abre uma conexão com o banco, importando a planilha de participantes na primeira vez.
+    """
+    caminho = caminho or config.ARQUIVO_BANCO
+    con = armazenamento.conectar(caminho)
+    if caminho not in _cadastros_verificados:
+        with con:
+            con.execute('BEGIN IMMEDIATE')
+            if con.execute('SELECT valor FROM versao_participantes WHERE id = 1').fetchone()[0] == 0:
+                if os.path.exists(config.ARQUIVO_PARTICIPANTES):
+                    _sincronizar_momentos(con, config.ARQUIVO_PARTICIPANTES)
+                con.execute(_SQL_NOVA_VERSAO)
+        _cadastros_verificados.add(caminho)
+    return con
+
+
+def _data_iso(valor):
+    # Data (date, datetime ou texto ISO) como texto aaaa-mm-dd; None fica em aberto
+    return None if valor is None else pd.Timestamp(valor).strftime('%Y-%m-%d')
+
+
+def _sincronizar_momentos(con, arquivo):
+    """
+    Marca os momentos de cada nome da planilha (cadastrando os nomes novos)
+    e desmarca os de quem não está mais nela.
+    """
+    planilha = pd.read_excel(arquivo)
+    con.execute('UPDATE participantes SET primeiro_momento = 0, segundo_momento = 0')
+    for momento, coluna in _COLUNAS_PLANILHA.items():
+        if coluna not in planilha:
+            continue
+        nomes = set(planilha[coluna].map(armazenamento.normalizar_nome).dropna())
+        con.executemany(f"""
+            INSERT INTO participantes (nome, {_COLUNAS_MOMENTO[momento]}) VALUES (?, 1)
+            ON CONFLICT (nome) DO UPDATE SET {_COLUNAS_MOMENTO[momento]} = 1
+        """, [(nome,) for nome in sorted(nomes)])
+
+
+def importar_planilha(arquivo=None, caminho=None):
+    """
+    Sincroniza os momentos do cadastro com a planilha (formato de participantes_momentos.xlsx).
+    Quem não está na planilha continua cadastrado, com o histórico, mas sem momento.
+    Retorna a quantidade de participantes em algum momento.
+    """
+    with closing(conectar(caminho)) as con:
+        with con:
+            con.execute('BEGIN IMMEDIATE')
+            _sincronizar_momentos(con, arquivo or config.ARQUIVO_PARTICIPANTES)
+            con.execute(_SQL_NOVA_VERSAO)
+        return con.execute(
+            'SELECT COUNT(*) FROM participantes WHERE primeiro_momento OR segundo_momento'
+        ).fetchone()[0]
+
+
+def versao(caminho=None):
+    """
+    Contador de alterações do cadastro.
+    """
+    with closing(conectar(caminho)) as con:
+        return con.execute('SELECT valor FROM versao_participantes WHERE id = 1').fetchone()[0]
+
+
+def carregar_participantes(momento=None, data=None, caminho=None):
+    """
+    Lista os participantes em ordem de nome. Com `momento` (1 ou 2), só os
+    desse momento; com `data`, só os ativos nessa data.
+    """
+    condicoes, parametros = [], []
+    if momento is not None:
+        condicoes.append(f'{_COLUNAS_MOMENTO[momento]} = 1')
+    if data is not None:
+        condicoes.append('(inicio IS NULL OR inicio <= ?) AND (fim IS NULL OR fim >= ?)')
+        parametros += [_data_iso(data)] * 2
+    where = f" WHERE {' AND '.join(condicoes)}" if condicoes else ''
+    sql = ('SELECT id AS "ID", nome AS "Nome", primeiro_momento AS "1º Momento", segundo_momento AS "2º Momento", '
+           f'inicio AS "Início", fim AS "Fim" FROM participantes{where} ORDER BY nome')
+    with closing(conectar(caminho)) as con:
+        df = pd.read_sql_query(sql, con, params=parametros)
+    return df.astype({'1º Momento': bool, '2º Momento': bool})
+
+
+def adicionar_participante(nome, momentos=(), inicio=None, fim=None, caminho=None):
+    """
+    Cadastra um participante nos momentos indicados e retorna o seu id.
+    """
+    with closing(conectar(caminho)) as con:
+        with con:
+            cursor = con.execute(
+                'INSERT INTO participantes (nome, primeiro_momento, segundo_momento, inicio, fim) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (armazenamento.normalizar_nome(nome), int(1 in momentos), int(2 in momentos),
+                 _data_iso(inicio), _data_iso(fim)),
+            )
+            con.execute(_SQL_NOVA_VERSAO)
+            return cursor.lastrowid
+
+
+def definir_participacao(id_participante, momentos, inicio=None, fim=None, caminho=None):
+    """
+    Define os momentos e o período ativo de um participante.
+    Retorna False se o participante não existir.
+    """
+    with closing(conectar(caminho)) as con:
+        with con:
+            cursor = con.execute(
+                'UPDATE participantes SET primeiro_momento = ?, segundo_momento = ?, inicio = ?, fim = ? '
+                'WHERE id = ?',
+                (int(1 in momentos), int(2 in momentos), _data_iso(inicio), _data_iso(fim), id_participante),
+            )
+            if cursor.rowcount == 0:
+                return False
+            con.execute(_SQL_NOVA_VERSAO)
+    return True
+
+
+def renomear_participante(id_participante, nome, caminho=None):
+    """
+    Troca o nome de um participante; o histórico acompanha, pois é gravado pelo id.
+    Retorna False se o participante não existir.
+    """
+    with closing(conectar(caminho)) as con:
+        with con:
+            cursor = con.execute(
+                'UPDATE participantes SET nome = ? WHERE id = ?', (armazenamento.normalizar_nome(nome), id_participante)
+            )
+            if cursor.rowcount == 0:
+                return False
+            con.execute(_SQL_NOVA_VERSAO)
+            # O nome aparece nas leituras do histórico: invalidar também os caches da análise
+            con.execute(_SQL_NOVA_VERSAO_DADOS)
+    return True
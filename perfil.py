@@ -0,0 +1,98 @@
+"""
+Perfil por amostragem de uma execução do app.
+
+Uma thread auxiliar lê, a cada config.INTERVALO_PERFIL_MS, a pilha da
+thread que executa o script (sys._current_frames) e conta quantas vezes
+cada pilha apareceu. O resultado é gravado em config.PERFIS_DIR no
+formato de pilhas colapsadas ("quadro;quadro;quadro contagem" por linha),
+aceito pelo flamegraph.pl, speedscope e similares. Cada quadro traz a
+função e a linha em execução, então o gráfico aponta a linha quente.
+
+Uso fora do app:
+    with perfil.Amostrador() as amostrador:
+        analise.resumir_registros()
+    amostrador.gravar('resumo')
+"""
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+
+import config
+
+_RAIZ = str(config.BASE_DIR)
+
+
+def _quadro(frame):
+    codigo = frame.f_code
+    return f'{codigo.co_name} ({os.path.basename(codigo.co_filename)}:{frame.f_lineno})'
+
+
+class Amostrador:
+    """
+    Amostrador da pilha da thread que chama iniciar() (por padrão).
+    """
+
+    def __init__(self, intervalo_ms=None, thread_id=None):
+        self.intervalo = (intervalo_ms or config.INTERVALO_PERFIL_MS) / 1000
+        self.thread_id = thread_id
+        self.pilhas = Counter()
+        self.amostras = 0
+        self.duracao = 0.0
+        self._parar = threading.Event()
+        self._thread = None
+
+    def iniciar(self):
+        self.thread_id = self.thread_id or threading.get_ident()
+        self._inicio = time.perf_counter()
+        self._thread = threading.Thread(target=self._amostrar, name='perfil', daemon=True)
+        self._thread.start()
+        return self
+
+    def parar(self):
+        self._parar.set()
+        self._thread.join()
+        self.duracao = time.perf_counter() - self._inicio
+        return self
+
+    def __enter__(self):
+        return self.iniciar()
+
+    def __exit__(self, *excecao):
+        self.parar()
+
+    def _amostrar(self):
+        while not self._parar.wait(self.intervalo):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None or self._parar.is_set():  # parada durante a leitura: é a própria parar()
+                continue
+            quadros = []
+            while frame is not None:
+                quadros.append(frame)
+                frame = frame.f_back
+            # Da raiz para a folha, a partir do primeiro quadro do projeto
+            # (os quadros acima são do executor de scripts do Streamlit)
+            quadros.reverse()
+            inicio = next((i for i, f in enumerate(quadros) if f.f_code.co_filename.startswith(_RAIZ)), 0)
+            self.pilhas[';'.join(_quadro(f) for f in quadros[inicio:])] += 1
+            self.amostras += 1
+
+    def colapsado(self):
+        """
+        Linhas "pilha contagem", das pilhas mais frequentes para as menos.
+        """
+        return [f'{pilha} {contagem}' for pilha, contagem in self.pilhas.most_common()]
+
+    def gravar(self, rotulo='app'):
+        """
+        Grava o perfil em config.PERFIS_DIR e retorna o caminho do arquivo.
+        """
+        os.makedirs(config.PERFIS_DIR, exist_ok=True)
+        nome = re.sub(r'[^0-9A-Za-z]+', '_', rotulo).strip('_').lower() or 'app'
+        caminho = os.path.join(config.PERFIS_DIR, f"{nome}_{datetime.now():%Y%m%d_%H%M%S}.folded")
+        with open(caminho, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(self.colapsado()) + '\n')
+        return caminho
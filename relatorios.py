@@ -0,0 +1,99 @@
+"""
+Relatórios de frequência de todos os participantes, sem Streamlit.
+
+Calcula, em uma só passada sobre o resumo de frequência, os indicadores e
+a frequência mensal de cada participante por momento, dividindo os
+participantes entre vários processos, e grava duas planilhas CSV.
+
+Uso (na raiz do projeto):
+    python relatorios.py --ano 2024
+    python relatorios.py --ano 2024 --saida data/relatorios --processos 4
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+import analise
+import armazenamento
+import config
+
+# Recortes de cada relatório: geral e por momento
+MOMENTOS = {'Geral': None, '1º Momento': 1, '2º Momento': 2}
+
+
+def relatorio_participantes(resumo):
+    """
+    Indicadores e frequência mensal de cada participante do resumo, por momento.
+    """
+    indicadores = []
+    mensal = []
+    for nome, df_pessoa in resumo.groupby('Nome', observed=True, sort=True):
+        for rotulo, momento in MOMENTOS.items():
+            df_momento = analise.filtrar(df_pessoa, momento)
+            if df_momento.empty:
+                continue
+            indicadores.append(analise.indicadores(df_momento).rename((nome, rotulo)))
+            mensal.append(
+                analise.percentual_mensal(df_momento)
+                .reset_index()
+                .assign(Nome=nome, Momento=rotulo)
+            )
+
+    indicadores = pd.DataFrame(indicadores).infer_objects()
+    if not indicadores.empty:
+        indicadores.index = pd.MultiIndex.from_tuples(indicadores.index, names=['Nome', 'Momento'])
+    mensal = pd.concat(mensal, ignore_index=True) if mensal else pd.DataFrame()
+    return indicadores, mensal
+
+
+def _lotes(itens, quantidade):
+    tamanho = -(-len(itens) // quantidade)
+    return [itens[i:i + tamanho] for i in range(0, len(itens), tamanho)]
+
+
+def gerar_relatorios(ano=None, processos=None, caminho=None):
+    """
+    Calcula os relatórios de todos os participantes usando um pool de processos.
+    """
+    resumo = armazenamento.carregar_resumo(caminho)
+    if ano is not None:
+        resumo = resumo[resumo['Ano'] == ano]
+    nomes = sorted(resumo['Nome'].unique())
+    if not nomes:
+        return pd.DataFrame(), pd.DataFrame()
+
+    processos = min(processos or os.cpu_count() or 1, len(nomes))
+    if processos == 1:
+        partes = [relatorio_participantes(resumo)]
+    else:
+        # Cada processo recebe só o resumo dos seus participantes
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            partes = list(executor.map(
+                relatorio_participantes,
+                [resumo[resumo['Nome'].isin(lote)] for lote in _lotes(nomes, processos)],
+            ))
+
+    indicadores = pd.concat([parte[0] for parte in partes])
+    mensal = pd.concat([parte[1] for parte in partes], ignore_index=True)
+    return indicadores, mensal[['Nome', 'Momento', 'Mês/Ano', 'Registros', 'Presentes', 'Frequência', 'Ausência']]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Relatórios de frequência de todos os participantes')
+    parser.add_argument('--ano', type=int, help='ano dos relatórios (padrão: todos)')
+    parser.add_argument('--saida', default=os.path.join(config.DATA_DIR, 'relatorios'))
+    parser.add_argument('--processos', type=int, help='processos em paralelo (padrão: núcleos da máquina)')
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    indicadores, mensal = gerar_relatorios(args.ano, args.processos)
+
+    os.makedirs(args.saida, exist_ok=True)
+    sufixo = f'_{args.ano}' if args.ano else ''
+    indicadores.to_csv(os.path.join(args.saida, f'indicadores{sufixo}.csv'))
+    mensal.to_csv(os.path.join(args.saida, f'frequencia_mensal{sufixo}.csv'), index=False)
+    print(f"{len(indicadores.index.unique('Nome')) if len(indicadores) else 0} participantes em "
+          f"{time.perf_counter() - inicio:.2f} s; relatórios gravados em {args.saida}")